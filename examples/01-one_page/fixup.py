@@ -5,8 +5,26 @@ This demonstrates basic fixup processing for a straightforward document
 with minimal structural issues.
 """
 
+import re
 from typing import Dict, Any, List
 
+# Classification keywords and prefixes, built once at import rather than per element
+_TITLE_KEYWORDS = ("simple document", "test")
+_SECTION_HEADER_KEYWORDS = (
+    "basic text",
+    "list processing",
+    "numbered lists",
+    "code and technical",
+    "conclusion",
+)
+_LIST_ITEM_PREFIXES = ("•", "-", "*", "1.", "2.", "3.")
+_CODE_PREFIXES = ("def ", "    ", "return ")
+
+# Keyword groups compiled to one alternation each so a single C-level scan of
+# the content decides membership (instead of one substring scan per keyword).
+_TITLE_RE = re.compile("|".join(map(re.escape, _TITLE_KEYWORDS)))
+_SECTION_HEADER_RE = re.compile("|".join(map(re.escape, _SECTION_HEADER_KEYWORDS)))
+
 
 def fixup(structure: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -24,26 +42,29 @@ def fixup(structure: Dict[str, Any]) -> Dict[str, Any]:
         Modified structure with basic fixups applied
     """
 
-    # Create a copy to avoid modifying the original
+    # Copy-on-write: only the containers we change (the structure, each page, its
+    # element list, fixed elements, metadata) are copied. Everything else is shared
+    # with the input, which is never modified, so no deep copy is needed.
     fixed_structure = structure.copy()
 
     # Process the single page
-    for page in fixed_structure.get("pages", []):
-        elements = page.get("elements", [])
+    fixed_pages = []
+    for page in structure.get("pages", []):
+        fixed_page = page.copy()
 
         # Apply basic text element fixes
-        elements = _fix_text_elements(elements)
+        fixed_page["elements"] = _fix_text_elements(page.get("elements", []))
+        fixed_pages.append(fixed_page)
 
-        # Update the page with fixed elements
-        page["elements"] = elements
+    fixed_structure["pages"] = fixed_pages
 
     # Add fixup metadata
-    if "metadata" not in fixed_structure:
-        fixed_structure["metadata"] = {}
-
-    fixed_structure["metadata"]["fixup_applied"] = True
-    fixed_structure["metadata"]["fixup_module"] = "examples.01_one_page.fixup"
-    fixed_structure["metadata"]["fixup_type"] = "basic"
+    fixed_structure["metadata"] = {
+        **structure.get("metadata", {}),
+        "fixup_applied": True,
+        "fixup_module": "examples.01_one_page.fixup",
+        "fixup_type": "basic",
+    }
 
     return fixed_structure
 
@@ -51,19 +72,14 @@ def fixup(structure: Dict[str, Any]) -> Dict[str, Any]:
 def _fix_text_elements(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Apply basic fixes to text elements."""
 
-    fixed_elements = []
-
-    for element in elements:
-        if element.get("type") == "text":
-            # Fix text classification based on content
-            element = _classify_text_element(element)
-
-            # Fix bounding boxes
-            element = _fix_basic_bbox(element)
-
-        fixed_elements.append(element)
-
-    return fixed_elements
+    # Single comprehension: no per-element list.append lookup in the loop body.
+    # Text elements are copied once, then the helpers fix the copy in place.
+    return [
+        _fix_basic_bbox(_classify_text_element(element.copy()))
+        if element.get("type") == "text"
+        else element
+        for element in elements
+    ]
 
 
 def _classify_text_element(element: Dict[str, Any]) -> Dict[str, Any]:
@@ -74,22 +90,13 @@ def _classify_text_element(element: Dict[str, Any]) -> Dict[str, Any]:
         content_lower = content.lower().strip()
 
         # Classify based on content patterns
-        if any(keyword in content_lower for keyword in ["simple document", "test"]):
+        if _TITLE_RE.search(content_lower):
             element["classification"] = "title"
-        elif any(
-            keyword in content_lower
-            for keyword in [
-                "basic text",
-                "list processing",
-                "numbered lists",
-                "code and technical",
-                "conclusion",
-            ]
-        ):
+        elif _SECTION_HEADER_RE.search(content_lower):
             element["classification"] = "section_header"
-        elif content_lower.startswith(("•", "-", "*", "1.", "2.", "3.")):
+        elif content_lower.startswith(_LIST_ITEM_PREFIXES):
             element["classification"] = "list_item"
-        elif content_lower.startswith(("def ", "    ", "return ")):
+        elif content_lower.startswith(_CODE_PREFIXES):
             element["classification"] = "code"
         else:
             element["classification"] = "paragraph"
@@ -103,13 +110,13 @@ def _fix_basic_bbox(element: Dict[str, Any]) -> Dict[str, Any]:
     bbox = element.get("bbox", [])
     if len(bbox) == 4:
         x1, y1, x2, y2 = bbox
-
-        # Ensure bounding box is valid
-        if x2 <= x1 or y2 <= y1:
-            # Fix invalid bounding boxes with reasonable defaults
-            element["bbox"] = [x1, y1, x1 + 200, y1 + 20]
-        elif (x2 - x1) < 10 or (y2 - y1) < 5:
-            # Fix tiny bounding boxes
-            element["bbox"] = [x1, y1, x1 + 100, y1 + 15]
+        width = x2 - x1
+        height = y2 - y1
+
+        # Invalid (inverted/empty) boxes are also tiny, so one test covers both cases;
+        # the replacement size is then chosen arithmetically rather than by a branch
+        if width < 10 or height < 5:
+            invalid = width <= 0 or height <= 0
+            element["bbox"] = [x1, y1, x1 + 100 + 100 * invalid, y1 + 15 + 5 * invalid]
 
     return element
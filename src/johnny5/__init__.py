@@ -1,11 +1,34 @@
 """Johnny5 - Document disassembly and reassembly framework"""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "William Wieselquist"
 
-from .cli import main
-from .disassembler import run_disassemble
-from .recomposer import json_to_qmd, json_to_html
-from .server import run_web
+if TYPE_CHECKING:
+    from .cli import main
+    from .disassembler import run_disassemble
+    from .recomposer import json_to_qmd, json_to_html
+    from .server import run_web
+
+# Public name -> submodule defining it. Submodules are imported on first access
+# (PEP 562) so importing the package, e.g. for the CLI, doesn't pull in Docling/FastAPI.
+_LAZY_ATTRS = {
+    "main": ".cli",
+    "run_disassemble": ".disassembler",
+    "json_to_qmd": ".recomposer",
+    "json_to_html": ".recomposer",
+    "run_web": ".server",
+}
 
 __all__ = ["main", "run_disassemble", "json_to_qmd", "json_to_html", "run_web"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing a public name on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
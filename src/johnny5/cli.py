@@ -1,14 +1,13 @@
 import click
+import os
 import subprocess
 import sys
 import warnings
-import tempfile
-import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from .disassembler import run_disassemble, check_docling_version
-from .server import run_web
-from .qmd_checker import check_qmd_file, format_check_results
+from typing import Optional, Tuple
+from .render import render_qmd_to_pdf
 
 # Suppress RuntimeWarning about module loading
 warnings.filterwarnings("ignore", category=RuntimeWarning, module="runpy")
@@ -24,24 +23,88 @@ def main() -> None:
 
 
 @main.command()
-@click.argument("pdf", type=click.Path(exists=True, path_type=Path))
+@click.argument("pdfs", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
 @click.option("--enable-ocr", is_flag=True)
 @click.option("--fixup", default="johnny5.fixups.example_fixup")
-def disassemble(pdf: Path, enable_ocr: bool, fixup: str) -> None:
+@click.option(
+    "--exclude-pages",
+    default="",
+    help="Comma-separated page numbers (1-indexed) to skip, e.g. covers or blank pages",
+)
+@click.option(
+    "--device",
+    default="auto",
+    help='Device for model inference: "auto" (GPU if available), "cpu", "cuda", "mps"',
+)
+@click.option(
+    "--pdf-backend",
+    type=click.Choice(["pypdfium", "docling-parse"]),
+    default="pypdfium",
+    help="PDF parsing backend (pypdfium is faster and uses less memory)",
+)
+@click.option(
+    "--include-density",
+    is_flag=True,
+    help="Embed page density profiles in the JSON (the web viewer computes them on demand)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of PDFs to convert in parallel (default: half the number of CPUs)",
+)
+def disassemble(
+    pdfs: Tuple[Path, ...],
+    enable_ocr: bool,
+    fixup: str,
+    exclude_pages: str,
+    device: str,
+    pdf_backend: str,
+    include_density: bool,
+    jobs: Optional[int],
+) -> None:
     """Disassemble PDF -> Lossless JSON (with content-based caching).
 
-    Outputs cache key to stdout for chaining commands.
+    Outputs the cache key of each PDF to stdout, one per line, for chaining commands.
     All logging goes to stderr.
 
     Example:
         CACHE_KEY=$(jny5 disassemble document.pdf)
         echo "Cache key: $CACHE_KEY"
     """
+    # Imported here so other commands (and --help) don't pay for loading Docling
+    from .disassembler import run_disassemble_batch, check_docling_version
+
+    try:
+        excluded = {int(page) for page in exclude_pages.split(",") if page.strip()}
+    except ValueError:
+        raise click.BadParameter(
+            f"Expected comma-separated page numbers, got {exclude_pages!r}",
+            param_hint="--exclude-pages",
+        )
+    # Pages are 1-indexed; anything lower would only change the cache key
+    if excluded and min(excluded) < 1:
+        raise click.BadParameter(
+            f"Page numbers start at 1, got {min(excluded)}", param_hint="--exclude-pages"
+        )
+
     try:
         check_docling_version()
-        cache_key = run_disassemble(pdf, enable_ocr, fixup)
-        # Output cache key to stdout (per spec: for command chaining)
-        print(cache_key)
+        # A single PDF (or a single cache miss) is converted in this process
+        cache_keys = run_disassemble_batch(
+            list(pdfs),
+            enable_ocr,
+            fixup,
+            exclude_pages=excluded or None,
+            device=device,
+            pdf_backend=pdf_backend,
+            include_density=include_density,
+            max_workers=jobs,
+        )
+        # Output cache keys to stdout (per spec: for command chaining)
+        for cache_key in cache_keys:
+            print(cache_key)
     except Exception:
         # Error already logged to stderr by run_disassemble
         sys.exit(1)
@@ -56,6 +119,9 @@ def disassemble(pdf: Path, enable_ocr: bool, fixup: str) -> None:
 )
 def web(pdf: Path, port: int, fixup: str, color: str) -> None:
     """Launch the web viewer"""
+    # Imported here so other commands (and --help) don't pay for loading FastAPI/Docling
+    from .server import run_web
+
     run_web(pdf, port, fixup, color_scheme=color.lower())
 
 
@@ -63,6 +129,8 @@ def web(pdf: Path, port: int, fixup: str, color: str) -> None:
 @click.argument("file", type=click.Path(exists=True, path_type=Path))
 def check(file: Path) -> None:
     """Check file for quality issues based on file extension (currently supports .qmd)"""
+    from .qmd_checker import check_qmd_file, format_check_results
+
     try:
         # Check file extension and route to appropriate checker
         if file.suffix.lower() == ".qmd":
@@ -85,55 +153,49 @@ def check(file: Path) -> None:
 
 
 @main.command()
-@click.argument("file", type=click.Path(exists=True, path_type=Path))
-def to_pdf(file: Path) -> None:
-    """Render file to PDF based on file extension (currently supports .qmd using Quarto)"""
-    try:
-        # Check file extension and route to appropriate renderer
-        if file.suffix.lower() == ".qmd":
-            # Create a temporary directory for Quarto rendering
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Copy the QMD file to the temporary directory
-                temp_qmd = temp_path / file.name
-                shutil.copy2(file, temp_qmd)
-
-                # Run quarto render command in the temporary directory
-                cmd = ["quarto", "render", str(temp_qmd), "--to", "pdf"]
-
-                subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-                # Copy the generated PDF back to the original directory
-                temp_pdf = temp_path / f"{file.stem}.pdf"
-                final_pdf = file.parent / f"{file.stem}.pdf"
-                shutil.copy2(temp_pdf, final_pdf)
-
-                # Clean up any auxiliary files that Quarto might have created in the original directory
-                aux_extensions = [
-                    ".aux",
-                    ".log",
-                    ".out",
-                    ".toc",
-                    ".fdb_latexmk",
-                    ".fls",
-                    ".synctex.gz",
-                ]
-                for ext in aux_extensions:
-                    aux_file = file.parent / f"{file.stem}{ext}"
-                    if aux_file.exists():
-                        aux_file.unlink()
-
-                print(f"✅ PDF generated: {final_pdf}")
-        else:
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of files to render in parallel (default: number of CPUs)",
+)
+def to_pdf(files: Tuple[Path, ...], jobs: Optional[int]) -> None:
+    """Render files to PDF based on file extension (currently supports .qmd using Quarto)"""
+    # Check file extensions up front so nothing is rendered if any file is unsupported
+    for file in files:
+        if file.suffix.lower() != ".qmd":
             raise click.ClickException(
                 f"Unsupported file type: {file.suffix}. Currently only .qmd files are supported."
             )
 
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error rendering file to PDF: {e}")
-        print(f"Quarto output: {e.stderr}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print("❌ Quarto not found. Please install Quarto to render QMD files to PDF.")
+    # Repeated paths are rendered once: two renders of one file would share its
+    # intermediate and auxiliary files
+    files = tuple(dict.fromkeys(file.resolve() for file in files))
+
+    # Each render is a separate Quarto process, so threads are enough to run them in
+    # parallel; the Deno/Pandoc/LaTeX startup of each file then overlaps with the others
+    max_workers = min(jobs or os.cpu_count() or 1, len(files))
+    failed = False
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(render_qmd_to_pdf, file): file for file in files}
+        for future in as_completed(futures):
+            try:
+                print(f"✅ PDF generated: {future.result()}")
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Error rendering {futures[future]} to PDF: {e}")
+                print(f"Quarto output: {e.stderr}")
+                failed = True
+            except RuntimeError as e:
+                # Quarto is missing, so the queued renders would fail the same way
+                print(f"❌ {e}")
+                failed = True
+                executor.shutdown(cancel_futures=True)
+                break
+            except OSError as e:
+                print(f"❌ Failed to write PDF for {futures[future]}: {e}")
+                failed = True
+
+    if failed:
         sys.exit(1)
@@ -6,37 +6,70 @@ This module handles the core PDF disassembly workflow:
 3. Save corrected JSON to _cache/
 """
 
+import functools
 import json
 import logging
 import importlib
+import multiprocessing
 import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Type, cast
 
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+import orjson
+from docling.datamodel.accelerator_options import AcceleratorOptions
 
 from .utils.margins import analyze_page_margins
-from .utils.density import calculate_density
+from .utils.density import calculate_document_densities
 from .utils.fixup_context import FixupContext
 from .utils.cache import (
+    JSON_CACHE_OPTIONS,
+    JSON_DUMP_OPTIONS,
     generate_disassemble_cache_key,
     get_cached_file,
     get_cache_dir,
     save_to_cache,
+    write_bytes_atomic,
 )
 
+# Docling's converter, pipelines and backends pull in torch and the model registries
+# (seconds of import time and hundreds of MB), so they are imported only where a
+# converter is built: importing this module for fixups or the web server stays cheap.
+if TYPE_CHECKING:
+    from docling.backend.pdf_backend import PdfDocumentBackend
+    from docling.document_converter import DocumentConverter
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Source mtime of each fixup module when it was last imported, for hot reloading
+_fixup_mtimes: Dict[str, Optional[int]] = {}
+
+# PDF parsing backends by name, as (module, class) imported when a converter is built.
+# pypdfium is the default: for the layout clusters used here it matches docling-parse,
+# while being faster and using less memory per page.
+_PDF_BACKENDS: Dict[str, Tuple[str, str]] = {
+    "pypdfium": ("docling.backend.pypdfium2_backend", "PyPdfiumDocumentBackend"),
+    "docling-parse": ("docling.backend.docling_parse_v4_backend", "DoclingParseV4DocumentBackend"),
+}
+DEFAULT_PDF_BACKEND = "pypdfium"
+
+# Guards _get_converter, so concurrent callers never build the same converter twice
+_converter_lock = threading.Lock()
+
 
 def run_disassemble(
     pdf: Path,
     enable_ocr: bool,
     fixup: str,
     force_refresh: bool = False,
+    exclude_pages: Optional[Set[int]] = None,
+    device: str = "auto",
+    pdf_backend: str = DEFAULT_PDF_BACKEND,
+    include_density: bool = False,
 ) -> str:
     """
     Convert a PDF into Docling lossless JSON with content-based caching.
@@ -52,17 +85,29 @@ def run_disassemble(
         enable_ocr: Whether to enable OCR processing for text extraction
         fixup: Module path for fixup processing (hot-reloadable)
         force_refresh: If True, reprocess even if cache exists (default: False)
+        exclude_pages: 1-indexed page numbers (covers, blank pages, ...) whose elements
+            are not extracted; they are kept as empty pages marked "skipped"
+        device: Device for Docling model inference: "auto" (default: GPU if available),
+            "cpu", "cuda", "cuda:N", "mps", or "xpu"
+        pdf_backend: PDF parsing backend, "pypdfium" (default) or "docling-parse"
+        include_density: If True, embed each page's density profiles as "_density"
+            (default: False; the web viewer computes them on demand)
 
     Returns:
         16-character cache key identifying the cached structure JSON
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
-        ValueError: If PDF processing fails
+        ValueError: If PDF processing fails or pdf_backend is unknown
     """
     # Check Docling version requirement
     check_docling_version()
 
+    if pdf_backend not in _PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend {pdf_backend!r}, expected one of {sorted(_PDF_BACKENDS)}"
+        )
+
     logger.info(f"Starting PDF disassembly: {pdf}")
     logger.info(f"OCR: {enable_ocr}")
 
@@ -71,7 +116,9 @@ def run_disassemble(
         raise FileNotFoundError(f"PDF file not found: {pdf}")
 
     # Step 1: Generate cache key from PDF content + Docling options
-    cache_key, pdf_checksum = generate_disassemble_cache_key(pdf, enable_ocr)
+    cache_key, pdf_checksum = _disassemble_cache_key(
+        pdf, enable_ocr, exclude_pages, pdf_backend, include_density
+    )
     logger.info(f"Cache key: {cache_key}")
     logger.info(f"PDF checksum: {pdf_checksum}")
 
@@ -101,7 +148,15 @@ def run_disassemble(
             logger.info("Cache miss - running Docling conversion")
 
         try:
-            docling_result = _run_docling_conversion(pdf, enable_ocr, pdf_checksum)
+            docling_result = _run_docling_conversion(
+                pdf,
+                enable_ocr,
+                pdf_checksum,
+                exclude_pages,
+                device,
+                pdf_backend,
+                include_density,
+            )
 
             # Save to cache with cache key as filename
             cache_file = save_to_cache(docling_result, cache_key, "structure")
@@ -119,39 +174,231 @@ def run_disassemble(
         file_handler.close()
 
 
-def _run_docling_conversion(pdf: Path, enable_ocr: bool, pdf_checksum: str) -> Dict[str, Any]:
+def run_disassemble_batch(
+    pdfs: List[Path],
+    enable_ocr: bool,
+    fixup: str,
+    force_refresh: bool = False,
+    exclude_pages: Optional[Set[int]] = None,
+    device: str = "auto",
+    pdf_backend: str = DEFAULT_PDF_BACKEND,
+    include_density: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[str]:
     """
-    Convert PDF to lossless JSON using Docling DocumentConverter.
+    Disassemble several PDFs, converting cache misses in parallel worker processes.
+
+    Each PDF is disassembled exactly as by run_disassemble with the same options. Cache
+    keys are checked up front, so cached PDFs cost no worker; the others are converted
+    concurrently, each worker using an equal share of the CPUs for Docling's models.
+
+    Args:
+        pdfs: Paths to the PDF files to process
+        enable_ocr: Whether to enable OCR processing for text extraction
+        fixup: Module path for fixup processing (hot-reloadable)
+        force_refresh: If True, reprocess even if cache exists (default: False)
+        exclude_pages: 1-indexed page numbers to skip in every PDF (see run_disassemble)
+        device: Device for Docling model inference (see run_disassemble)
+        pdf_backend: PDF parsing backend (see run_disassemble)
+        include_density: If True, embed page density profiles (see run_disassemble)
+        max_workers: Maximum number of worker processes (default: half the CPUs)
+
+    Returns:
+        Cache keys of the PDFs, in the order given
+
+    Raises:
+        FileNotFoundError: If a PDF file doesn't exist
+        ValueError: If processing a PDF fails or pdf_backend is unknown
+    """
+    for pdf in pdfs:
+        if not pdf.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf}")
+
+    run = functools.partial(
+        run_disassemble,
+        enable_ocr=enable_ocr,
+        fixup=fixup,
+        force_refresh=force_refresh,
+        exclude_pages=exclude_pages,
+        device=device,
+        pdf_backend=pdf_backend,
+        include_density=include_density,
+    )
+
+    def is_cached(pdf: Path) -> bool:
+        cache_key, _ = _disassemble_cache_key(
+            pdf, enable_ocr, exclude_pages, pdf_backend, include_density
+        )
+        return get_cached_file(cache_key, "structure") is not None
+
+    # Duplicates are converted once, also with force_refresh; hits need no worker
+    unique_pdfs = list(dict.fromkeys(pdfs))
+    misses = [pdf for pdf in unique_pdfs if force_refresh or not is_cached(pdf)]
+    cpu_count = os.cpu_count() or 1
+    workers = min(max_workers or max(1, cpu_count // 2), len(misses))
+    if workers <= 1:
+        keys = {pdf: run(pdf) for pdf in unique_pdfs}
+        return [keys[pdf] for pdf in pdfs]
+
+    logger.info(f"Disassembling {len(misses)} PDFs in {workers} worker processes")
+    # Spawn rather than fork: Docling's thread pools must not be inherited mid-flight
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+        initargs=(max(1, cpu_count // workers),),
+    ) as executor:
+        keys = dict(zip(misses, executor.map(run, misses)))
+
+    # Cache hits only have their keys looked up
+    for pdf in unique_pdfs:
+        if pdf not in keys:
+            keys[pdf] = run(pdf)
+    return [keys[pdf] for pdf in pdfs]
+
+
+def _init_batch_worker(num_threads: int) -> None:
+    """
+    Give a batch worker process its share of the CPUs for Docling model inference.
+
+    Args:
+        num_threads: Number of threads, unless DOCLING_NUM_THREADS/OMP_NUM_THREADS is set
+    """
+    if "DOCLING_NUM_THREADS" not in os.environ and "OMP_NUM_THREADS" not in os.environ:
+        os.environ["DOCLING_NUM_THREADS"] = str(num_threads)
+
+
+def _disassemble_cache_key(
+    pdf: Path,
+    enable_ocr: bool,
+    exclude_pages: Optional[Set[int]],
+    pdf_backend: str,
+    include_density: bool,
+) -> Tuple[str, str]:
+    """
+    Generate the disassemble cache key for run_disassemble's options.
+
+    Returns:
+        Tuple of (16-character cache key, 64-character PDF checksum)
+    """
+    return generate_disassemble_cache_key(
+        pdf,
+        enable_ocr,
+        exclude_pages,
+        # The default backend is left out, so keys from before backends were selectable
+        # stay valid
+        pdf_backend if pdf_backend != DEFAULT_PDF_BACKEND else None,
+        include_density,
+    )
+
+
+def _get_converter(
+    enable_ocr: bool,
+    num_threads: int,
+    device: str = "auto",
+    pdf_backend: str = DEFAULT_PDF_BACKEND,
+) -> "DocumentConverter":
+    """
+    Get the Docling converter for the given options, creating it on first use.
+
+    Converters are cached per option set: Docling loads its layout (and OCR) models
+    when a converter first runs, so reusing the converter keeps those models loaded
+    across disassemblies, e.g. in the web server. Lookups hold _converter_lock, so
+    concurrent first calls (background disassemblies in the server) share one
+    converter instead of each building their own.
 
     Args:
-        pdf: Path to PDF file
         enable_ocr: Whether to enable OCR
-        pdf_checksum: SHA-256 checksum of the PDF file
+        num_threads: Number of CPU threads for model inference
+        device: Device for model inference (see run_disassemble)
+        pdf_backend: PDF parsing backend name (see run_disassemble)
 
     Returns:
-        Dictionary containing Docling's lossless JSON structure
+        Configured DocumentConverter instance
     """
-    logger.debug("Initializing Docling converter (Docling 2.0: docling_layout_heron)")
+    with _converter_lock:
+        return _build_converter(enable_ocr, num_threads, device, pdf_backend)
+
+
+@functools.lru_cache(maxsize=2)
+def _build_converter(
+    enable_ocr: bool, num_threads: int, device: str, pdf_backend: str
+) -> "DocumentConverter":
+    """Build a Docling converter, cached per option set (use _get_converter)."""
+    logger.debug(
+        "Initializing Docling converter (Docling 2.0: docling_layout_heron), "
+        f"threads={num_threads}, device={device}, backend={pdf_backend}"
+    )
+
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
 
     # Initialize converter with PdfFormatOption and configure pipeline options
     pdf_opt = PdfFormatOption()
-    # Use PyPdfiumDocumentBackend explicitly (matches main branch behavior)
-    pdf_opt.backend = PyPdfiumDocumentBackend
+    pdf_opt.backend = _pdf_backend_class(pdf_backend)
     # Start from defaults and override fields explicitly
     pdf_options = PdfPipelineOptions()
     pdf_options.do_ocr = enable_ocr
+    pdf_options.accelerator_options = AcceleratorOptions(num_threads=num_threads, device=device)
     # Docling 2.0: layout model is always docling_layout_heron (set by default)
     pdf_opt.pipeline_options = pdf_options
 
-    converter = DocumentConverter(format_options={InputFormat.PDF: pdf_opt})
+    return DocumentConverter(format_options={InputFormat.PDF: pdf_opt})
+
+
+def _pdf_backend_class(pdf_backend: str) -> Type["PdfDocumentBackend"]:
+    """Import the Docling backend class for a PDF backend name (see _PDF_BACKENDS)."""
+    module_name, class_name = _PDF_BACKENDS[pdf_backend]
+    backend: Type["PdfDocumentBackend"] = getattr(importlib.import_module(module_name), class_name)
+    return backend
+
+
+def _docling_num_threads() -> int:
+    """
+    Get the number of CPU threads for Docling model inference.
+
+    DOCLING_NUM_THREADS or OMP_NUM_THREADS is honored when set. Otherwise all CPUs are
+    used: Docling's own default of 4 threads leaves most of a larger machine idle.
+
+    Returns:
+        Number of threads
+    """
+    if "DOCLING_NUM_THREADS" in os.environ or "OMP_NUM_THREADS" in os.environ:
+        return AcceleratorOptions().num_threads
+    return os.cpu_count() or 4
+
+
+def _run_docling_conversion(
+    pdf: Path,
+    enable_ocr: bool,
+    pdf_checksum: str,
+    exclude_pages: Optional[Set[int]] = None,
+    device: str = "auto",
+    pdf_backend: str = DEFAULT_PDF_BACKEND,
+    include_density: bool = False,
+) -> Dict[str, Any]:
+    """
+    Convert PDF to lossless JSON using Docling DocumentConverter.
+
+    Args:
+        pdf: Path to PDF file
+        enable_ocr: Whether to enable OCR
+        pdf_checksum: SHA-256 checksum of the PDF file
+        exclude_pages: 1-indexed page numbers to keep as empty, skipped pages
+        device: Device for Docling model inference (see run_disassemble)
+        pdf_backend: PDF parsing backend name (see run_disassemble)
+        include_density: Whether to compute and embed page density profiles
+
+    Returns:
+        Dictionary containing Docling's lossless JSON structure
+    """
+    converter = _get_converter(enable_ocr, _docling_num_threads(), device, pdf_backend)
 
     # Convert document
     logger.debug("Running Docling conversion")
     result = converter.convert(str(pdf))
 
-    # Extract the document structure - use model_dump() to get the full structure
-    doc_dict = result.model_dump()
-
     # Build metadata and extract pages from Docling's structure
     # Convert to file:// URI (absolute path)
     pdf_uri = pdf.resolve().as_uri()
@@ -161,58 +408,60 @@ def _run_docling_conversion(pdf: Path, enable_ocr: bool, pdf_checksum: str) -> D
         "_checksum": pdf_checksum,
         "layout_model": "docling_layout_heron",  # Docling 2.0 always uses this
         "ocr_enabled": enable_ocr,
+        "pdf_backend": pdf_backend,
     }
 
-    pages = cast(List[Dict[str, Any]], doc_dict.get("pages", []))
-
     pages_data: List[Dict[str, Any]] = []
-    for page_idx, page_dict in enumerate(pages):
-        logger.debug(f"Processing page {page_idx + 1}")
+    structure = _new_document_structure()
+    for page_number, page in enumerate(result.pages, start=1):
+        logger.debug(f"Processing page {page_number}")
+
+        # Docling's page models are read directly rather than dumped to dicts first:
+        # dumping would copy every cluster with all its text cells just to read a few
+        # fields. Excluded pages only need their size: no clusters are extracted.
+        skipped = exclude_pages is not None and page_number in exclude_pages
 
         # Get page dimensions from page size
-        size = page_dict.get("size", {})
-        if isinstance(size, dict):
-            width = size.get("width", 612)
-            height = size.get("height", 792)
+        size = page.size
+        if size is not None:
+            width = size.width
+            height = size.height
         else:
             width = 612
             height = 792
 
+        # Process page predictions/layout to extract elements
+        layout = page.predictions.layout
+        clusters = layout.clusters if layout is not None and not skipped else []
+        page_elements = [
+            element_data
+            for element_data in (
+                _extract_element_data_from_cluster(cluster, page_number) for cluster in clusters
+            )
+            if element_data
+        ]
+
         page_data: Dict[str, Any] = {
-            "page_number": page_idx + 1,
+            "page_number": page_number,
             "width": width,
             "height": height,
-            "elements": [],
+            "elements": page_elements,
         }
+        if skipped:
+            page_data["skipped"] = True
 
-        # Process page predictions/layout to extract elements
-        predictions = page_dict.get("predictions", {})
-        layout = predictions.get("layout", {})
-        clusters = layout.get("clusters", [])
-
-        page_elements = cast(List[Dict[str, Any]], page_data["elements"])
-        for cluster in clusters:
-            element_data = _extract_element_data_from_cluster(cluster, page_idx + 1, width, height)
-            if element_data:
-                page_elements.append(element_data)
+        # Analyze page-level properties and summarize the page into the document
+        # structure while its elements are at hand (no second pass over all pages)
+        page_data["margins"] = analyze_page_margins(page_elements)
+        _add_page_structure(structure, page_number, page_elements)
 
         pages_data.append(page_data)
 
-    # Now process each page with density profiles
-    for page_data in pages_data:
-        # Analyze page-level properties
-        elements = cast(List[Dict[str, Any]], page_data["elements"])
-        page_data["margins"] = analyze_page_margins(elements)
-
-        # Compute density profiles for visualization
-        x_profile = calculate_density(elements, page_data["width"], page_data["height"], "x")
-        y_profile = calculate_density(elements, page_data["width"], page_data["height"], "y")
-        page_data["_density"] = {
-            "x": x_profile,
-            "y": y_profile,
-        }
-
-    structure = _extract_document_structure(pages_data)
+    # Compute density profiles for visualization (across processes for long documents).
+    # They are derived from the elements, so by default they are left out of the JSON.
+    if include_density:
+        for page_data, density in zip(pages_data, calculate_document_densities(pages_data)):
+            page_data["_density"] = density
 
     json_data: Dict[str, Any] = {
         "metadata": metadata,
@@ -224,58 +473,30 @@ def _run_docling_conversion(pdf: Path, enable_ocr: bool, pdf_checksum: str) -> D
     return json_data
 
 
-def _extract_element_data_from_cluster(
-    cluster: Dict[str, Any], page_number: int, page_width: float, page_height: float
-) -> Optional[Dict[str, Any]]:
+def _extract_element_data_from_cluster(cluster: Any, page_number: int) -> Optional[Dict[str, Any]]:
     """
-    Extract structured data from a Docling cluster (from lossless JSON format).
+    Extract structured data from a Docling layout cluster.
 
     Args:
-        cluster: Docling cluster dictionary
+        cluster: Docling Cluster (label, bbox with l/t/r/b, confidence, text cells)
         page_number: Page number for context
-        page_width: Page width in points
-        page_height: Page height in points
 
     Returns:
         Dictionary containing element data, or None if element should be skipped
     """
     try:
-        # Extract label/type
-        label = cluster.get("label", "unknown")
-
-        # Extract bounding box
-        bbox_dict = cluster.get("bbox", {})
-        if isinstance(bbox_dict, dict):
-            # Format: {"l": left, "t": top, "r": right, "b": bottom}
-            x0 = bbox_dict.get("l", 0)
-            y0 = bbox_dict.get("t", 0)
-            x1 = bbox_dict.get("r", page_width)
-            y1 = bbox_dict.get("b", page_height)
-        elif isinstance(bbox_dict, list) and len(bbox_dict) == 4:
-            x0, y0, x1, y1 = bbox_dict
-        else:
-            return None
-
-        element_data = {
-            "type": label,
+        bbox = cluster.bbox
+        element_data: Dict[str, Any] = {
+            "type": cluster.label,
             "page": page_number,
-            "bbox": [x0, y0, x1, y1],
-            "confidence": cluster.get("confidence", 1.0),
+            "bbox": [bbox.l, bbox.t, bbox.r, bbox.b],
+            "confidence": cluster.confidence,
         }
 
-        # Extract text content
-        if "text" in cluster:
-            element_data["content"] = str(cluster["text"]).strip()
-        elif "cells" in cluster:
-            # Extract text from cells
-            text_parts = []
-            for cell in cluster.get("cells", []):
-                if isinstance(cell, dict) and "text" in cell:
-                    text_parts.append(cell["text"])
-                elif isinstance(cell, str):
-                    text_parts.append(cell)
-            if text_parts:
-                element_data["content"] = " ".join(text_parts)
+        # Extract text content from the cluster's text cells
+        text_parts = [cell.text for cell in cluster.cells]
+        if text_parts:
+            element_data["content"] = " ".join(text_parts)
 
         return element_data
 
@@ -286,97 +507,170 @@ def _extract_element_data_from_cluster(
 
 def _extract_table_data(table: Any) -> Dict[str, Any]:
     """Extract structured data from a Docling table."""
+    # getattr with a default is one lookup, where hasattr + access is two
     return {
-        "rows": len(table.rows) if hasattr(table, "rows") else 0,
-        "cols": len(table.cols) if hasattr(table, "cols") else 0,
-        "cells": [
-            {
-                "row": cell.row_idx,
-                "col": cell.col_idx,
-                "content": cell.text if hasattr(cell, "text") else "",
-                "bbox": [cell.bbox.x0, cell.bbox.y0, cell.bbox.x1, cell.bbox.y1],
-            }
-            for cell in getattr(table, "cells", [])
-        ],
+        "rows": len(getattr(table, "rows", ())),
+        "cols": len(getattr(table, "cols", ())),
+        "cells": [_extract_table_cell(cell) for cell in getattr(table, "cells", [])],
+    }
+
+
+def _extract_table_cell(cell: Any) -> Dict[str, Any]:
+    """Extract structured data from a Docling table cell."""
+    bbox = cell.bbox
+    return {
+        "row": cell.row_idx,
+        "col": cell.col_idx,
+        "content": getattr(cell, "text", ""),
+        "bbox": [bbox.x0, bbox.y0, bbox.x1, bbox.y1],
     }
 
 
 def _extract_figure_data(figure: Any) -> Dict[str, Any]:
     """Extract structured data from a Docling figure."""
+    bbox = figure.bbox
     return {
         "caption": getattr(figure, "caption", ""),
         "image_path": getattr(figure, "image_path", ""),
-        "bbox": [figure.bbox.x0, figure.bbox.y0, figure.bbox.x1, figure.bbox.y1],
+        "bbox": [bbox.x0, bbox.y0, bbox.x1, bbox.y1],
     }
 
 
-def _extract_document_structure(pages: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def _new_document_structure() -> Dict[str, List[Dict[str, Any]]]:
+    """Create an empty document structure summary."""
+    return {
+        "tables": [],
+        "figures": [],
+        "text_blocks": [],
+    }
+
+
+def _add_page_structure(
+    structure: Dict[str, List[Dict[str, Any]]], page_num: int, elements: List[Dict[str, Any]]
+) -> None:
+    """
+    Add a page's tables, figures, and text blocks to the document structure.
+
+    Args:
+        structure: Document structure summary to extend in place
+        page_num: Page number (1-indexed)
+        elements: The page's extracted elements
+    """
+    for element in elements:
+        # One hashed lookup per element instead of a chain of string comparisons
+        append = _STRUCTURE_APPENDERS.get(element["type"])
+        if append is not None:
+            append(structure, page_num, element)
+
+
+def _append_table(
+    structure: Dict[str, List[Dict[str, Any]]], page_num: int, element: Dict[str, Any]
+) -> None:
+    """Add a table element to the document structure."""
+    table = element.get("table", {})
+    structure["tables"].append(
+        {
+            "page": page_num,
+            "bbox": element["bbox"],
+            "rows": table.get("rows", 0),
+            "cols": table.get("cols", 0),
+        }
+    )
+
+
+def _append_figure(
+    structure: Dict[str, List[Dict[str, Any]]], page_num: int, element: Dict[str, Any]
+) -> None:
+    """Add a figure element to the document structure."""
+    structure["figures"].append(
+        {
+            "page": page_num,
+            "bbox": element["bbox"],
+            "caption": element.get("figure", {}).get("caption", ""),
+        }
+    )
+
+
+def _append_text_block(
+    structure: Dict[str, List[Dict[str, Any]]], page_num: int, element: Dict[str, Any]
+) -> None:
+    """Add a text element to the document structure."""
+    structure["text_blocks"].append(
+        {
+            "page": page_num,
+            "bbox": element["bbox"],
+            "text": element.get("content", ""),
+            "type": element["type"],
+        }
+    )
+
+
+# Element type -> function adding it to the document structure (other types are skipped)
+_STRUCTURE_APPENDERS: Dict[
+    str, Callable[[Dict[str, List[Dict[str, Any]]], int, Dict[str, Any]], None]
+] = {
+    "table": _append_table,
+    "figure": _append_figure,
+    "text": _append_text_block,
+    "title": _append_text_block,
+    "heading": _append_text_block,
+}
+
+
+def _import_fixup_module(fixup: str) -> ModuleType:
     """
-    Extract high-level document structure from processed pages.
+    Import a fixup module, reloading it if its source file changed since last use.
 
     Args:
-        pages: List of processed page data
+        fixup: Module path for fixup processing
 
     Returns:
-        Dictionary containing tables, figures, and text blocks
+        The imported (or reloaded) fixup module
     """
-    structure: Dict[str, List[Dict[str, Any]]] = {
-        "tables": [],
-        "figures": [],
-        "text_blocks": [],
-    }
+    module = sys.modules.get(fixup)
+    if module is None:
+        module = importlib.import_module(fixup)
+    elif fixup in _fixup_mtimes and _fixup_mtimes[fixup] != _source_mtime_ns(module):
+        logger.info(f"Fixup module {fixup} changed on disk, reloading")
+        module = importlib.reload(module)
+    _fixup_mtimes[fixup] = _source_mtime_ns(module)
+    return module
 
-    for page in pages:
-        page_num = page["page_number"]
-
-        for element in page["elements"]:
-            if element["type"] == "table":
-                structure["tables"].append(
-                    {
-                        "page": page_num,
-                        "bbox": element["bbox"],
-                        "rows": element.get("table", {}).get("rows", 0),
-                        "cols": element.get("table", {}).get("cols", 0),
-                    }
-                )
-            elif element["type"] == "figure":
-                structure["figures"].append(
-                    {
-                        "page": page_num,
-                        "bbox": element["bbox"],
-                        "caption": element.get("figure", {}).get("caption", ""),
-                    }
-                )
-            elif element["type"] in ["text", "title", "heading"]:
-                structure["text_blocks"].append(
-                    {
-                        "page": page_num,
-                        "bbox": element["bbox"],
-                        "text": element.get("content", ""),
-                        "type": element["type"],
-                    }
-                )
-
-    return structure
+
+def _source_mtime_ns(module: ModuleType) -> Optional[int]:
+    """Get the modification time of a module's source file, if it has one."""
+    try:
+        return os.stat(module.__file__).st_mtime_ns if module.__file__ else None
+    except OSError:
+        return None
 
 
 def _apply_fixup_rules(docling_result: Dict[str, Any], fixup: str, pdf: Path) -> Dict[str, Any]:
     """
     Apply fixup processing to Docling result using the specified module.
 
+    The context shares the pages, structure and metadata of docling_result, so a fixup
+    edits the document in place and returns None; nothing is copied. A fixup may also
+    return a new result dict instead.
+
     Args:
         docling_result: Raw Docling JSON result
-        fixup: Module path for fixup processing
+        fixup: Module path for fixup processing (empty to skip fixups)
         pdf: Original PDF path for context
 
     Returns:
         Corrected JSON result after fixup processing
     """
+    if not fixup:
+        # Nothing to import, apply, or recompute: the result is already final
+        logger.debug("No fixup module given, skipping fixup processing")
+        return docling_result
+
     logger.debug(f"Loading fixup module: {fixup}")
 
     try:
         # Import fixup module (hot-reloadable)
-        module = importlib.import_module(fixup)
+        module = _import_fixup_module(fixup)
 
         if not hasattr(module, "apply_fixup"):
             logger.warning(f"Fixup module {fixup} missing apply_fixup function")
@@ -395,18 +689,17 @@ def _apply_fixup_rules(docling_result: Dict[str, Any], fixup: str, pdf: Path) ->
         corrected_result_raw = module.apply_fixup(context)
 
         if corrected_result_raw is None:
-            logger.warning("Fixup module returned None, using original result")
-            return docling_result
-
-        if not isinstance(corrected_result_raw, dict):
+            # Edited in place through the context
+            corrected_result = docling_result
+        elif isinstance(corrected_result_raw, dict):
+            corrected_result = cast(Dict[str, Any], corrected_result_raw)
+        else:
             logger.warning("Fixup module returned non-dict result, using original result")
             return docling_result
 
-        corrected_result = cast(Dict[str, Any], corrected_result_raw)
-
         # Recompute density arrays for corrected result
         logger.debug("Recomputing density arrays after fixup")
-        corrected_result = _recompute_density_arrays(corrected_result)
+        corrected_result = _recompute_density_arrays(corrected_result, context.dirty_pages)
 
         logger.info("Fixup processing completed successfully")
         return corrected_result
@@ -420,48 +713,65 @@ def _apply_fixup_rules(docling_result: Dict[str, Any], fixup: str, pdf: Path) ->
         return docling_result
 
 
-def _recompute_density_arrays(result: Dict[str, Any]) -> Dict[str, Any]:
+def _recompute_density_arrays(
+    result: Dict[str, Any], dirty_pages: Optional[Set[int]] = None
+) -> Dict[str, Any]:
     """
     Recompute density profiles after fixup processing.
 
+    Only pages that already carry a "_density" profile are refreshed; pages without one
+    (disassembled without include_density) get theirs computed on demand.
+
     Args:
         result: Document result (may be modified by fixup)
+        dirty_pages: Page numbers whose elements changed (default: None, all pages)
 
     Returns:
         Result with updated density profiles
     """
-    # Update density profiles for each page
-    pages = cast(List[Dict[str, Any]], result["pages"])
-    for page_data in pages:
-        elements = cast(List[Dict[str, Any]], page_data["elements"])
-        x_profile = calculate_density(elements, page_data["width"], page_data["height"], "x")
-        y_profile = calculate_density(elements, page_data["width"], page_data["height"], "y")
-        page_data["_density"] = {
-            "x": x_profile,
-            "y": y_profile,
-        }
+    # Update density profiles for each changed page
+    pages = [
+        page
+        for page in cast(List[Dict[str, Any]], result["pages"])
+        if "_density" in page and (dirty_pages is None or page.get("page_number") in dirty_pages)
+    ]
+    for page_data, density in zip(pages, calculate_document_densities(pages)):
+        page_data["_density"] = density
 
     return result
 
 
-def _write_json(data: Dict[str, Any], output_path: Path) -> None:
+def _write_json(data: Dict[str, Any], output_path: Path, indent: bool = False) -> None:
     """
     Write JSON data to file with proper encoding and formatting.
 
     Args:
         data: Dictionary to serialize as JSON
         output_path: Path where to write the JSON file
+        indent: If True, indent by 2 spaces for reading by people (default: False, compact)
     """
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    options = JSON_DUMP_OPTIONS if indent else JSON_CACHE_OPTIONS
+    write_bytes_atomic(output_path, orjson.dumps(data, option=options))
 
 
-def load_docling_pipeline(enable_ocr: bool) -> DocumentConverter:
+def load_docling_pipeline(
+    enable_ocr: bool,
+    num_threads: Optional[int] = None,
+    device: str = "auto",
+    pdf_backend: str = DEFAULT_PDF_BACKEND,
+) -> "DocumentConverter":
     """
     Load and configure Docling pipeline with specified options.
 
+    This is the cached converter run_disassemble uses for the same options, so its
+    models are loaded only once. Table structure and cell matching are Docling defaults.
+
     Args:
         enable_ocr: Whether to enable OCR
+        num_threads: CPU threads for model inference (default: from the environment,
+            otherwise all CPUs)
+        device: Device for model inference (see run_disassemble)
+        pdf_backend: PDF parsing backend name (see run_disassemble)
 
     Returns:
         Configured DocumentConverter instance
@@ -469,21 +779,7 @@ def load_docling_pipeline(enable_ocr: bool) -> DocumentConverter:
     # Check Docling version requirement
     check_docling_version()
 
-    logger.debug(f"Loading Docling pipeline (Docling 2.0: docling_layout_heron), ocr={enable_ocr}")
-
-    pdf_opt = PdfFormatOption()
-    # Use PyPdfiumDocumentBackend explicitly (matches main branch behavior)
-    pdf_opt.backend = PyPdfiumDocumentBackend
-    pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = enable_ocr
-    pipeline_options.do_table_structure = True
-    pipeline_options.table_structure_options.do_cell_matching = True
-    # Docling 2.0: layout model is always docling_layout_heron (set by default)
-    pdf_opt.pipeline_options = pipeline_options
-
-    converter = DocumentConverter(format_options={InputFormat.PDF: pdf_opt})
-
-    return converter
+    return _get_converter(enable_ocr, num_threads or _docling_num_threads(), device, pdf_backend)
 
 
 def apply_fixups(content: Dict[str, Any], fixup: str) -> Dict[str, Any]:
@@ -524,19 +820,18 @@ def get_available_layout_models() -> List[Dict[str, str]]:
     # Try to load models from version-specific cache
     jny5_home = Path(os.environ.get("JNY5_HOME", str(Path.home() / ".jny5")))
     models_dir = jny5_home / "models"
-    models_dir.mkdir(parents=True, exist_ok=True)
-
     models_cache_file = models_dir / f"{docling_version}.json"
 
-    if models_cache_file.exists():
-        try:
-            with open(models_cache_file, "r", encoding="utf-8") as f:
-                cached_models = json.load(f)
-                if isinstance(cached_models, list) and len(cached_models) > 0:
-                    logger.debug(f"Loaded layout models from cache: {models_cache_file}")
-                    return cached_models
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load models cache: {e}, using defaults")
+    # Just open the file: a missing cache is the exceptional case, so no exists() check
+    try:
+        cached_models = orjson.loads(models_cache_file.read_bytes())
+        if isinstance(cached_models, list) and len(cached_models) > 0:
+            logger.debug(f"Loaded layout models from cache: {models_cache_file}")
+            return cast(List[Dict[str, str]], cached_models)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to load models cache: {e}, using defaults")
 
     # Docling 2.0+ only: always uses docling_layout_heron
     models = [
@@ -549,6 +844,8 @@ def get_available_layout_models() -> List[Dict[str, str]]:
 
     # Save defaults to cache for future reference and manual editing
     try:
+        # Only needed to write the cache, not on every lookup
+        models_dir.mkdir(parents=True, exist_ok=True)
         with open(models_cache_file, "w", encoding="utf-8") as f:
             json.dump(models, f, indent=2, ensure_ascii=False)
         logger.info(f"Saved default models to cache: {models_cache_file}")
@@ -559,9 +856,13 @@ def get_available_layout_models() -> List[Dict[str, str]]:
     return models
 
 
+@functools.lru_cache(maxsize=1)
 def get_docling_version() -> str:
     """Get the current Docling version.
 
+    Memoized: the installed version can't change within a process, and the lookup reads
+    distribution metadata from disk on every run_disassemble call.
+
     Returns:
         Version string (e.g., '2.58.0')
     """
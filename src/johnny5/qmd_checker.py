@@ -9,6 +9,23 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List
 
+# Headings nested four or more levels deep, matched against a stripped line
+_DEEP_HEADING_RE = re.compile(r"#{4,}")
+
+
+def _pipe_positions(line: str) -> List[int]:
+    """Return the column index of every pipe in a line.
+
+    A str.find loop scans for the literal character in C, without running the regex
+    engine once per table line.
+    """
+    positions = []
+    index = line.find("|")
+    while index >= 0:
+        positions.append(index)
+        index = line.find("|", index + 1)
+    return positions
+
 
 class QMDChecker:
     """Quality checker for QMD files."""
@@ -16,6 +33,8 @@ class QMDChecker:
     def __init__(self, file_path: Path):
         self.file_path = file_path
         self.content = self._read_file()
+        # Split once; every check walks the same lines
+        self.lines: List[str] = self.content.split("\n")
         self.issues: List[str] = []
 
     def _read_file(self) -> str:
@@ -42,11 +61,9 @@ class QMDChecker:
         checks["yaml_frontmatter"] = self.check_yaml_frontmatter()
         checks["markdown_syntax"] = self.check_markdown_syntax()
 
-        # Collect all issues
+        # Collect all issues (every check reports a list of strings)
         for check_result in checks.values():
-            check_issues = check_result.get("issues", [])
-            if isinstance(check_issues, list):
-                issues.extend(str(issue) for issue in check_issues)
+            issues.extend(check_result["issues"])
 
         return results
 
@@ -56,12 +73,11 @@ class QMDChecker:
         tables_found = 0
         tables_aligned = 0
 
-        lines: List[str] = self.content.split("\n")
         in_table = False
         table_lines = []
         table_start_line = 0
 
-        for i, line in enumerate(lines, 1):
+        for i, line in enumerate(self.lines, 1):
             # Check if this line is a table row
             if self._is_table_row(line):
                 if not in_table:
@@ -103,11 +119,13 @@ class QMDChecker:
 
     def _is_table_header(self, line: str) -> bool:
         """Check if line is a table header."""
-        return bool(re.match(r"^\s*\|.*\|.*\|", line.strip()))
+        stripped = line.strip()
+        return stripped.startswith("|") and stripped.count("|") >= 3
 
     def _is_table_row(self, line: str) -> bool:
         """Check if line is a table row."""
-        return bool(re.match(r"^\s*\|.*\|", line.strip()))
+        stripped = line.strip()
+        return stripped.startswith("|") and stripped.count("|") >= 2
 
     def _check_table_alignment(self, table_lines: List[str], start_line: int) -> Dict[str, Any]:
         """Check alignment of a specific table."""
@@ -118,21 +136,27 @@ class QMDChecker:
 
         # Find pipe positions in first line
         first_line = table_lines[0]
-        pipe_positions = [m.start() for m in re.finditer(r"\|", first_line)]
+        pipe_positions = _pipe_positions(first_line)
 
-        if len(pipe_positions) < 2:
+        num_pipes = len(pipe_positions)
+        if num_pipes < 2:
             return {"aligned": True, "issues": []}
 
         # Check each subsequent line
         for i, line in enumerate(table_lines[1:], 1):
-            line_pipe_positions = [m.start() for m in re.finditer(r"\|", line)]
+            line_pipe_positions = _pipe_positions(line)
+
+            # Aligned rows compare equal as lists, without a per-pipe loop
+            if line_pipe_positions == pipe_positions:
+                continue
 
             # Check if pipe positions match
-            if len(line_pipe_positions) != len(pipe_positions):
+            if len(line_pipe_positions) != num_pipes:
                 issues.append(f"Line {start_line + i}: Table has inconsistent number of columns")
                 continue
 
-            # Check if pipes are aligned
+            # Report the first misaligned pipe only: later pipes in a shifted row are
+            # usually off by the same shift and would repeat the issue per column
             for j, (expected_pos, actual_pos) in enumerate(
                 zip(pipe_positions, line_pipe_positions)
             ):
@@ -141,6 +165,7 @@ class QMDChecker:
                         f"Line {start_line + i}, column {j + 1}: Pipe misaligned "
                         f"(expected position {expected_pos}, found at {actual_pos})"
                     )
+                    break
 
         return {"aligned": len(issues) == 0, "issues": issues}
 
@@ -153,7 +178,7 @@ class QMDChecker:
             return {"issues": issues, "has_frontmatter": False}
 
         # Find end of frontmatter
-        lines = self.content.split("\n")
+        lines = self.lines
         frontmatter_end = -1
 
         for i, line in enumerate(lines[1:], 1):
@@ -187,16 +212,17 @@ class QMDChecker:
         """Check basic markdown syntax issues."""
         issues = []
 
-        lines = self.content.split("\n")
+        lines = self.lines
 
         # Check for common issues
         for i, line in enumerate(lines, 1):
-            # Check for trailing whitespace
-            if line.endswith(" ") or line.endswith("\t"):
+            # Check for trailing whitespace (one rstrip call, which returns the line itself
+            # when there is none to strip)
+            if len(line.rstrip(" \t")) != len(line):
                 issues.append(f"Line {i}: Trailing whitespace")
 
             # Check for inconsistent heading levels
-            if re.match(r"^#{4,}", line.strip()):
+            if _DEEP_HEADING_RE.match(line.strip()):
                 issues.append(f"Line {i}: Heading level 4+ (consider restructuring)")
 
         return {"issues": issues, "total_lines": len(lines)}
@@ -1,8 +1,11 @@
 """Johnny5 Recomposer - JSON to QMD/HTML conversion"""
 
+import functools
+import html
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
+
+import orjson
 
 
 def json_to_qmd(json_path: Path, output_path: Optional[Path] = None) -> Path:
@@ -22,8 +25,7 @@ def json_to_qmd(json_path: Path, output_path: Optional[Path] = None) -> Path:
     print(f"📝 Converting {json_path} to QMD")
 
     # Load JSON data
-    with open(json_path, "r") as f:
-        data = json.load(f)
+    data = _load_json(json_path)
 
     # TODO: Implement JSON to QMD conversion
     # 1. Parse structure from JSON
@@ -77,8 +79,9 @@ def json_to_html(json_path: Path, output_path: Optional[Path] = None) -> Path:
     print(f"🌐 Converting {json_path} to HTML")
 
     # Load JSON data
-    with open(json_path, "r") as f:
-        data = json.load(f)
+    data = _load_json(json_path)
+    # Metadata values such as the PDF's file name are text, not markup
+    metadata = {key: html.escape(str(value)) for key, value in data["metadata"].items()}
 
     # TODO: Implement JSON to HTML conversion
     # 1. Generate HTML structure
@@ -104,10 +107,10 @@ def json_to_html(json_path: Path, output_path: Optional[Path] = None) -> Path:
     
     <div class="metadata">
         <h2>Processing Information</h2>
-        <p><strong>Source PDF:</strong> {data['metadata']['source_pdf']}</p>
-        <p><strong>Layout Model:</strong> {data['metadata']['layout_model']}</p>
-        <p><strong>OCR Enabled:</strong> {data['metadata']['ocr_enabled']}</p>
-        <p><strong>JSON DPI:</strong> {data['metadata']['json_dpi']}</p>
+        <p><strong>Source PDF:</strong> {metadata['source_pdf']}</p>
+        <p><strong>Layout Model:</strong> {metadata['layout_model']}</p>
+        <p><strong>OCR Enabled:</strong> {metadata['ocr_enabled']}</p>
+        <p><strong>JSON DPI:</strong> {metadata['json_dpi']}</p>
     </div>
     
     <div class="structure">
@@ -130,6 +133,24 @@ def json_to_html(json_path: Path, output_path: Optional[Path] = None) -> Path:
     return output_path
 
 
+def _load_json(json_path: Path) -> Dict[str, Any]:
+    """Load a Johnny5 JSON file, reusing the parsed data while the file is unchanged
+
+    Converting one file to both QMD and HTML parses it once. The returned dict is shared
+    between calls and must not be mutated.
+    """
+    stat = json_path.stat()
+    return _parse_json(str(json_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_json(path: str, size: int, mtime_ns: int) -> Dict[str, Any]:
+    """Decode a JSON file's raw bytes with orjson; size and mtime_ns only key the cache"""
+    with open(path, "rb") as f:
+        data: Dict[str, Any] = orjson.loads(f.read())
+    return data
+
+
 def process_structure(data: Dict[str, Any]) -> Dict[str, Any]:
     """Process and normalize document structure from JSON"""
     # TODO: Implement structure processing
@@ -0,0 +1,57 @@
+"""Johnny5 Renderer - QMD to PDF rendering using Quarto"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Auxiliary files LaTeX may leave next to the source while Quarto renders a PDF
+AUX_EXTENSIONS = (".aux", ".log", ".out", ".toc", ".fdb_latexmk", ".fls", ".synctex.gz")
+
+
+def render_qmd_to_pdf(file: Path) -> Path:
+    """
+    Render a QMD file to PDF with Quarto, writing the PDF next to the source.
+
+    Args:
+        file: Path to the QMD file to render
+
+    Returns:
+        Path to the generated PDF file
+
+    Raises:
+        subprocess.CalledProcessError: If Quarto fails to render the file
+        RuntimeError: If Quarto is not installed
+        OSError: If the rendered PDF can't be moved next to the source
+    """
+    # Create a temporary directory for Quarto output
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Render the QMD in place (relative resources resolve next to it) and
+        # send the output to the temporary directory, so the source isn't copied
+        cmd = ["quarto", "render", file.name, "--to", "pdf", "--output-dir", temp_dir]
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=file.parent)
+        except FileNotFoundError as e:
+            # Only a missing executable means Quarto isn't installed; OSErrors from
+            # moving the PDF below are reported as they are
+            raise RuntimeError(
+                "Quarto not found. Please install Quarto to render QMD files to PDF."
+            ) from e
+
+        # Move the generated PDF to the original directory (a rename on one filesystem)
+        final_pdf = file.parent / f"{file.stem}.pdf"
+        shutil.move(str(Path(temp_dir) / final_pdf.name), str(final_pdf))
+
+    _remove_aux_files(file)
+    return final_pdf
+
+
+def _remove_aux_files(file: Path) -> None:
+    """Remove auxiliary files Quarto/LaTeX may have left next to the source file."""
+    # One directory scan instead of an exists()/unlink() pair per extension
+    aux_names = {f"{file.stem}{ext}" for ext in AUX_EXTENSIONS}
+    with os.scandir(file.parent) as entries:
+        for entry in entries:
+            if entry.name in aux_names and entry.is_file():
+                os.unlink(entry.path)
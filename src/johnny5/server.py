@@ -12,6 +12,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -23,6 +24,12 @@ from .disassembler import check_docling_version
 
 JSONDict = Dict[str, Any]
 
+# Number of parsed structure documents kept in memory by the web app
+STRUCTURE_CACHE_SIZE = 4
+
+# Maximum pending SSE frames per client before the oldest ones are dropped
+SSE_QUEUE_SIZE = 256
+
 
 class DisassembleOptions(BaseModel):
     """Request body for disassemble-refresh endpoint (Docling 2.0+)"""
@@ -49,12 +56,21 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
     from fastapi.staticfiles import StaticFiles
     from fastapi.templating import Jinja2Templates
     from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
-    import json
     import logging
     import asyncio
+    import mmap
     import shutil
-    from .disassembler import run_disassemble, get_available_layout_models, check_docling_version
+    from email.utils import parsedate
+    import orjson
+    from .disassembler import (
+        run_disassemble,
+        get_available_layout_models,
+        check_docling_version,
+    )
+    from .utils.density import calculate_document_densities, calculate_page_density_arrays
     from .utils.cache import (
+        JSON_CACHE_OPTIONS,
+        JSON_DUMP_OPTIONS,
         get_cache_path,
         get_cache_dir,
         generate_disassemble_cache_key,
@@ -77,12 +93,25 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
     # Request ID Tracking: maps request_id to clients waiting for that request
     request_notifications: Dict[str, set[str]] = {}  # request_id -> set of instance_ids
 
-    # SSE Client Queues: per-instance_id notification queues
-    sse_client_queues: Dict[str, asyncio.Queue[Dict[str, Any]]] = {}  # instance_id -> queue
+    # SSE Client Queues: per-instance_id queues of serialized SSE frames (bounded)
+    sse_client_queues: Dict[str, asyncio.Queue[str]] = {}  # instance_id -> queue
+
+    # Structure Cache: parsed structure JSON keyed by cache_key (in-memory, bounded)
+    # cache_key -> ((st_mtime_ns, st_size), data)
+    structure_cache: Dict[str, Tuple[Tuple[int, int], JSONDict]] = {}
+
+    # Density Cache: profiles computed for pages without embedded "_density", kept apart
+    # from the shared structure data and dropped whenever that data is reloaded or evicted
+    density_cache: Dict[str, Dict[int, JSONDict]] = {}  # cache_key -> {page: profiles}
 
     # CLI PDF path (for initial load)
     cli_pdf_path: Path = Path(pdf).resolve()
 
+    # Johnny5 home directories, resolved once rather than from the environment per request
+    jny5_home = Path(os.environ.get("JNY5_HOME", Path.home() / ".jny5"))
+    upload_dir = jny5_home / "cache" / "uploads"
+    dump_dir = jny5_home / "cache" / "dumps"
+
     # Register CLI PDF in registry
     from .utils.cache import calculate_file_checksum
 
@@ -111,8 +140,6 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
                 pass
 
         # Check uploads directory
-        jny5_home = Path(os.environ.get("JNY5_HOME", Path.home() / ".jny5"))
-        upload_dir = jny5_home / "cache" / "uploads"
         if upload_dir.exists():
             for pdf_file in upload_dir.glob("*.pdf"):
                 try:
@@ -126,22 +153,46 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         return None
 
     def get_structure_data(cache_key: str) -> JSONDict:
-        """Load structure data for a specific cache_key"""
+        """Load structure data for a specific cache_key
+
+        Parsed documents are kept per cache_key together with the file's mtime and size,
+        so page-by-page requests reuse one parse until the cache file is rewritten.
+        The returned dict is shared between requests and must not be mutated.
+        """
         json_path = get_cache_path(cache_key, "structure")
         try:
-            if json_path.exists():
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = cast(JSONDict, json.load(f))
-                    server_logger.info(
-                        f"Loaded {len(data.get('pages', []))} pages from cache {cache_key}"
-                    )
-                    return data
-            else:
-                return {}
+            stat = json_path.stat()
+        except OSError:
+            structure_cache.pop(cache_key, None)
+            density_cache.pop(cache_key, None)
+            return {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = structure_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            # Parse straight from the page cache: no bytes copy of the file is made
+            with open(json_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        data = cast(JSONDict, orjson.loads(view))
         except Exception as e:
             server_logger.error(f"Failed to load structure data for {cache_key}: {e}")
             return {}
 
+        server_logger.info(f"Loaded {len(data.get('pages', []))} pages from cache {cache_key}")
+        structure_cache.pop(cache_key, None)
+        density_cache.pop(cache_key, None)
+        structure_cache[cache_key] = (stamp, data)
+        while len(structure_cache) > STRUCTURE_CACHE_SIZE:
+            # Dicts keep insertion order: drop the least recently loaded document
+            evicted = next(iter(structure_cache))
+            del structure_cache[evicted]
+            density_cache.pop(evicted, None)
+        return data
+
     def _update_job_status(cache_key: str, status: str, **updates: Any) -> None:
         """Update job status (DRY helper)"""
         nonlocal disassembly_jobs, server_logger
@@ -162,6 +213,67 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         """Check if structure_data has valid pages (DRY helper)"""
         return bool(structure_data and structure_data.get("pages"))
 
+    def _get_page_data(structure_data: JSONDict, page: int) -> Tuple[Optional[JSONDict], JSONDict]:
+        """Find a page (1-indexed) in structure_data (DRY helper)
+
+        Returns:
+            (page_data, {}) if the page exists, otherwise (None, error response)
+        """
+        pages = cast(List[JSONDict], structure_data.get("pages", []))
+        if page < 1 or page > len(pages):
+            return None, {"error": f"Page {page} not found (available: 1-{len(pages)})"}
+        return pages[page - 1], {}
+
+    def _get_page_density(cache_key: str, page: int, page_data: JSONDict) -> JSONDict:
+        """Get a page's density profiles, computing them if not embedded (DRY helper)
+
+        Structure JSON only embeds "_density" when disassembled with include_density;
+        otherwise the profiles are computed on first use and kept in density_cache,
+        leaving the shared structure data untouched.
+        """
+        density = page_data.get("_density")
+        if density:
+            return cast(JSONDict, density)
+        page_densities = density_cache.setdefault(cache_key, {})
+        if page not in page_densities:
+            page_densities[page] = calculate_page_density_arrays(
+                page_data.get("elements", []), page_data.get("width", 0), page_data.get("height", 0)
+            )
+        return page_densities[page]
+
+    def _json_response(payload: JSONDict) -> Response:
+        """Serialize a JSON response with orjson, bypassing FastAPI's encoder (DRY helper)
+
+        NumPy arrays (computed density profiles) are serialized natively.
+        """
+        return Response(
+            orjson.dumps(payload, option=JSON_CACHE_OPTIONS), media_type="application/json"
+        )
+
+    def _stat_file(path: Optional[Path]) -> Optional[os.stat_result]:
+        """Stat a file, returning None if there is no path or no such file"""
+        try:
+            return os.stat(path) if path else None
+        except OSError:
+            return None
+
+    def _is_not_modified(request: Request, response: Response) -> bool:
+        """Check whether a conditional request's cached copy matches the response
+
+        If-None-Match takes precedence over If-Modified-Since, as in StaticFiles.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip(" W/") for tag in if_none_match.split(",")]
+            return response.headers.get("etag") in tags
+        if_modified_since = parsedate(request.headers.get("if-modified-since", ""))
+        last_modified = parsedate(response.headers.get("last-modified", ""))
+        return (
+            if_modified_since is not None
+            and last_modified is not None
+            and if_modified_since >= last_modified
+        )
+
     async def run_disassembly_background(
         pdf_path: Path,
         fixup_module: str,
@@ -246,6 +358,14 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         """Send job completion notification to all clients subscribed to this request_id"""
         nonlocal request_notifications, sse_client_queues, server_logger
 
+        # Fast path: with nobody subscribed there is nothing to build or serialize
+        subscribers = request_notifications.get(request_id)
+        if not subscribers:
+            server_logger.warning(
+                f"[SSE] No subscribers for request_id={request_id}, cache_key={cache_key} (notification dropped)"
+            )
+            return
+
         notification = {
             "type": "job_complete",
             "request_id": request_id,
@@ -257,25 +377,26 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         if error:
             notification["error"] = error
 
+        # Serialize once and share the same SSE frame with every subscriber
+        frame = f"data: {orjson.dumps(notification).decode()}\n\n"
+
         # Send notification only to clients subscribed to this request_id
-        if request_id in request_notifications:
-            notified_count = 0
-            for instance_id in request_notifications[request_id]:
-                if instance_id in sse_client_queues:
-                    try:
-                        sse_client_queues[instance_id].put_nowait(notification)
-                        notified_count += 1
-                    except Exception as e:
-                        server_logger.warning(
-                            f"[SSE] Error sending notification to {instance_id}: {e}"
-                        )
-            if notified_count == 0:
-                server_logger.warning(
-                    f"[SSE] No active clients to notify for request_id={request_id}, cache_key={cache_key}"
-                )
-        else:
+        notified_count = 0
+        for instance_id in subscribers:
+            client_queue = sse_client_queues.get(instance_id)
+            if client_queue is None:
+                continue
+            try:
+                if client_queue.full():
+                    # Client isn't draining: drop its oldest frame to stay bounded
+                    client_queue.get_nowait()
+                client_queue.put_nowait(frame)
+                notified_count += 1
+            except Exception as e:
+                server_logger.warning(f"[SSE] Error sending notification to {instance_id}: {e}")
+        if notified_count == 0:
             server_logger.warning(
-                f"[SSE] No subscribers for request_id={request_id}, cache_key={cache_key} (notification dropped)"
+                f"[SSE] No active clients to notify for request_id={request_id}, cache_key={cache_key}"
             )
 
     # Mount static files
@@ -285,28 +406,54 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
     # Setup templates
     templates_path = Path(__file__).parent / "web" / "templates"
     templates = Jinja2Templates(directory=str(templates_path))
+    # Templates don't change while the server runs: skip the per-request mtime check
+    # and compile index.html once so the root handler only renders
+    templates.env.auto_reload = False
+    index_template = templates.env.get_template("index.html")
 
     @app.get("/", response_class=HTMLResponse)
     async def root(request: Request) -> Response:
-        return templates.TemplateResponse(
-            "index.html",
-            {"request": request, "color_scheme": color_scheme},
-        )
+        return HTMLResponse(index_template.render(request=request, color_scheme=color_scheme))
 
     @app.get("/api/pdf")
-    async def serve_pdf(pdf_checksum: str = Query(...)) -> FileResponse:
+    async def serve_pdf(request: Request, pdf_checksum: str = Query(...)) -> Response:
         """Serve the PDF file for PDF.js by checksum"""
-        pdf_path = get_pdf_by_checksum(pdf_checksum)
-        if not pdf_path or not pdf_path.exists():
+        # One stat serves both the existence check and the response headers for each of
+        # PDF.js's range requests: a registered PDF is served without the existence check
+        # of get_pdf_by_checksum, which is only needed to find an unregistered one
+        pdf_path = pdf_registry.get(pdf_checksum)
+        stat_result = _stat_file(pdf_path)
+        if stat_result is None:
+            pdf_path = get_pdf_by_checksum(pdf_checksum)
+            stat_result = _stat_file(pdf_path)
+        if not pdf_path or stat_result is None:
             raise HTTPException(
                 status_code=404, detail=f"PDF not found for checksum: {pdf_checksum}"
             )
 
-        return FileResponse(pdf_path, media_type="application/pdf")
+        # The URL is keyed by content checksum, so the browser may reuse what it fetched
+        response = FileResponse(
+            pdf_path,
+            media_type="application/pdf",
+            stat_result=stat_result,
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
+        # FileResponse sets ETag/Last-Modified and serves ranges but ignores conditional
+        # headers: answer a revalidation of the unchanged PDF without resending it
+        if _is_not_modified(request, response):
+            validators = ("etag", "last-modified", "cache-control")
+            return Response(
+                status_code=304, headers={key: response.headers[key] for key in validators}
+            )
+        return response
 
     @app.get("/api/pdf-info")
-    async def pdf_info(pdf_checksum: Optional[str] = Query(None)) -> JSONDict:
-        """Get PDF information for the web viewer by checksum or CLI PDF"""
+    async def pdf_info(pdf_checksum: Optional[str] = Query(None)) -> Response:
+        """Get PDF information for the web viewer by checksum or CLI PDF
+
+        Like the other JSON endpoints the viewer calls, the plain dict is encoded with
+        orjson, bypassing FastAPI's response validation and encoder.
+        """
         # If no checksum provided, use CLI PDF (for initial load)
         if not pdf_checksum:
             if cli_pdf_path.exists():
@@ -330,19 +477,25 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         except Exception as e:
             server_logger.warning(f"Could not calculate PDF checksum: {e}")
 
-        return {
-            "pdf_path": str(pdf_path),
-            "display_name": pdf_path.name,
-            "fixup_module": fixup,
-            "checksum": checksum,
-        }
+        return _json_response(
+            {
+                "pdf_path": str(pdf_path),
+                "display_name": pdf_path.name,
+                "fixup_module": fixup,
+                "checksum": checksum,
+            }
+        )
 
     @app.get("/api/disassembly-status")
     async def get_disassembly_status(
         pdf_checksum: str = Query(...),
         cache_key: str = Query(...),
-    ) -> JSONDict:
-        """Get disassembly status for a specific cache_key"""
+    ) -> Response:
+        """Get disassembly status for a specific cache_key
+
+        The viewer polls this while a job runs, so responses are encoded with orjson
+        like pdf_info.
+        """
         if get_pdf_by_checksum(pdf_checksum) is None:
             raise HTTPException(
                 status_code=404, detail=f"PDF not found for checksum: {pdf_checksum}"
@@ -369,7 +522,7 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
                             queue_position += 1
 
             job["queue_position"] = queue_position
-            return job
+            return _json_response(job)
 
         # Job doesn't exist - check if cache exists for this PDF
         cached_file = get_cached_file(cache_key, "structure")
@@ -392,17 +545,11 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
                     detail="Cache key does not belong to the provided PDF checksum",
                 )
 
-            return {
-                "status": "completed",
-                "cache_key": cache_key,
-                "cache_exists": True,
-            }
+            return _json_response(
+                {"status": "completed", "cache_key": cache_key, "cache_exists": True}
+            )
 
-        return {
-            "status": "pending",
-            "cache_key": cache_key,
-            "cache_exists": False,
-        }
+        return _json_response({"status": "pending", "cache_key": cache_key, "cache_exists": False})
 
     @app.get("/api/layout-models")
     async def get_layout_models() -> JSONDict:
@@ -484,39 +631,45 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
     async def get_structure(
         page: int,
         cache_key: str = Query(...),
-    ) -> JSONDict:
-        """Get structure data for a specific page by cache_key"""
+    ) -> Response:
+        """Get structure data for a specific page by cache_key
+
+        Serialized with orjson like get_density: the page may carry density profiles
+        computed as NumPy arrays, which FastAPI's encoder can't serialize.
+        """
         try:
             structure_data = get_structure_data(cache_key)
 
             if not _has_structure_data(structure_data):
-                return {"error": "No structure data available for this cache_key"}
-
-            pages = cast(List[JSONDict], structure_data.get("pages", []))
-
-            # Find the requested page (1-indexed)
-            if page < 1 or page > len(pages):
-                return {"error": f"Page {page} not found (available: 1-{len(pages)})"}
-
-            page_data = pages[page - 1]
-            return {
-                "page": page_data,
-                "metadata": structure_data.get("metadata", {}),
-                "structure": structure_data.get("structure", {}),
-            }
+                return _json_response({"error": "No structure data available for this cache_key"})
+
+            page_data, error = _get_page_data(structure_data, page)
+            if page_data is None:
+                return _json_response(error)
+            return _json_response(
+                {
+                    "page": page_data,
+                    "metadata": structure_data.get("metadata", {}),
+                    "structure": structure_data.get("structure", {}),
+                }
+            )
 
         except Exception as e:
             server_logger.error(
                 f"Error in get_structure for cache_key {cache_key}: {e}", exc_info=True
             )
-            return {"error": f"Failed to load structure: {str(e)}"}
+            return _json_response({"error": f"Failed to load structure: {str(e)}"})
 
     @app.get("/api/density/{page}")
     async def get_density(
         page: int,
         cache_key: str = Query(...),
-    ) -> JSONDict:
-        """Get density data for visualization by cache_key"""
+    ) -> Response:
+        """Get density data for visualization by cache_key
+
+        The payload is serialized directly with orjson: density series are long lists
+        of floats, and FastAPI's default jsonable_encoder pass would walk every value.
+        """
         try:
             structure_data = get_structure_data(cache_key)
 
@@ -524,32 +677,27 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
                 server_logger.warning(
                     f"Density data requested but structure_data not available for cache_key {cache_key}"
                 )
-                return {"error": "No density data available"}
-
-            pages = cast(List[JSONDict], structure_data.get("pages", []))
-
-            # Find the requested page (1-indexed)
-            if page < 1 or page > len(pages):
-                return {"error": f"Page {page} not found (available: 1-{len(pages)})"}
-
-            page_data = pages[page - 1]
-            density_data = page_data.get("_density", {})
-
-            if not density_data:
-                server_logger.warning(f"Page {page} has no _density data for cache_key {cache_key}")
-
-            return {
-                "x": density_data.get("x", []),
-                "y": density_data.get("y", []),
-                "page_width": page_data.get("width", 0),
-                "page_height": page_data.get("height", 0),
-            }
+                return _json_response({"error": "No density data available"})
+
+            page_data, error = _get_page_data(structure_data, page)
+            if page_data is None:
+                return _json_response(error)
+            density_data = _get_page_density(cache_key, page, page_data)
+
+            return _json_response(
+                {
+                    "x": density_data.get("x", []),
+                    "y": density_data.get("y", []),
+                    "page_width": page_data.get("width", 0),
+                    "page_height": page_data.get("height", 0),
+                }
+            )
 
         except Exception as e:
             server_logger.error(
                 f"Error in get_density for cache_key {cache_key}: {e}", exc_info=True
             )
-            return {"error": f"Failed to load density data: {str(e)}"}
+            return _json_response({"error": f"Failed to load density data: {str(e)}"})
 
     @app.post("/api/dump-density")
     async def dump_density(
@@ -572,9 +720,22 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
             }
 
             pages = cast(List[JSONDict], structure_data.get("pages", []))
+            # Compute all missing profiles in one batch off the event loop, into a local
+            # map: the structure data is shared between requests and must not be mutated
+            page_densities = dict(density_cache.get(cache_key, {}))
+            missing = [
+                idx
+                for idx, page_data in enumerate(pages, start=1)
+                if not page_data.get("_density") and idx not in page_densities
+            ]
+            computed = await asyncio.to_thread(
+                calculate_document_densities, [pages[idx - 1] for idx in missing]
+            )
+            page_densities.update(zip(missing, computed))
+
             for idx, page_data in enumerate(pages, start=1):
-                density_data = page_data.get("_density", {})
-                if density_data:
+                density_data = cast(JSONDict, page_data.get("_density") or page_densities[idx])
+                if len(density_data["x"]) or len(density_data["y"]):
                     dump_pages[str(idx)] = {
                         "x": density_data.get("x", []),
                         "y": density_data.get("y", []),
@@ -583,15 +744,14 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
                     }
 
             # Write to dump file
-            jny5_home = Path(os.environ.get("JNY5_HOME", Path.home() / ".jny5"))
-            dump_dir = jny5_home / "cache" / "dumps"
             dump_dir.mkdir(parents=True, exist_ok=True)
 
             timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
             dump_file = dump_dir / f"y-density-dump-{timestamp_str}.json"
 
-            with open(dump_file, "w", encoding="utf-8") as f:
-                json.dump(dump_data, f, indent=2)
+            # Encode the whole dump up front and write it with one call, rather than
+            # json.dump's many small writes through a text-mode file
+            dump_file.write_bytes(orjson.dumps(dump_data, option=JSON_DUMP_OPTIONS))
 
             return {
                 "success": True,
@@ -612,8 +772,6 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
     ) -> JSONDict:
         """Upload PDF and return pdf_checksum"""
         try:
-            jny5_home = Path(os.environ.get("JNY5_HOME", Path.home() / ".jny5"))
-            upload_dir = jny5_home / "cache" / "uploads"
             upload_dir.mkdir(parents=True, exist_ok=True)
             original_name = Path(file.filename or "uploaded.pdf").name
             uploaded_pdf = upload_dir / original_name
@@ -791,17 +949,16 @@ def _create_app(pdf: Union[str, Path], fixup: str, color_scheme: str = "dark") -
         """Server-Sent Events endpoint for completion notifications only"""
 
         async def event_generator() -> AsyncGenerator[str, None]:
-            # Create a queue for this instance_id
-            client_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+            # Create a bounded queue of serialized frames for this instance_id
+            client_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
             sse_client_queues[instance_id] = client_queue
 
             try:
                 # Connection established (no initial message needed)
                 while True:
                     try:
-                        # Wait for notifications from this client's queue
-                        notification = await asyncio.wait_for(client_queue.get(), timeout=30.0)
-                        yield f"data: {json.dumps(notification)}\n\n"
+                        # Wait for notification frames from this client's queue
+                        yield await asyncio.wait_for(client_queue.get(), timeout=30.0)
                     except asyncio.TimeoutError:
                         # Send keepalive comment every 30 seconds
                         yield ": keepalive\n\n"
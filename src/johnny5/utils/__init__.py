@@ -1,11 +1,19 @@
 """Johnny5 utilities package"""
 
-from .density import calculate_density
+from .density import (
+    calculate_density,
+    calculate_document_densities,
+    calculate_page_densities,
+    calculate_page_density_arrays,
+)
 from .margins import analyze_page_margins, analyze_margins
 from .fixup_context import FixupContext
 
 __all__ = [
     "calculate_density",
+    "calculate_document_densities",
+    "calculate_page_densities",
+    "calculate_page_density_arrays",
     "analyze_page_margins",
     "analyze_margins",
     "FixupContext",
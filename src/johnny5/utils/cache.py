@@ -12,16 +12,31 @@ Cache key generation follows the spec:
 All cache keys are 16-character truncated SHA-256 hashes.
 """
 
+import functools
 import hashlib
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Set
+
+import orjson
+
+# orjson options for JSON cache files: non-string dict keys converted to strings as
+# json.dump does, and NumPy arrays serialized natively. Cache files are only read by
+# Johnny5, so they are compact: indenting can double the size to write and read back.
+JSON_CACHE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# orjson options for JSON files meant for people (dumps): as above, with a 2-space indent
+JSON_DUMP_OPTIONS = JSON_CACHE_OPTIONS | orjson.OPT_INDENT_2
 
 
 def calculate_file_checksum(file_path: Path) -> str:
     """Calculate SHA-256 checksum of a file.
 
+    Checksums are memoized per (path, size, mtime), so repeated lookups of an unchanged
+    file, e.g. the viewer's PDF on every request, don't read it again.
+
     Args:
         file_path: Path to file to checksum
 
@@ -32,14 +47,44 @@ def calculate_file_checksum(file_path: Path) -> str:
         >>> calculate_file_checksum(Path("doc.pdf"))
         'a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0u1v2w3x4y5z6a7b8c9d0e1f2'
     """
-    hasher = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read file in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(8192), b""):
+    stat = os.stat(file_path)
+    return _file_checksum(str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _file_checksum(path: str, size: int, mtime_ns: int) -> str:
+    """Hash a file's content; size and mtime_ns only key the cache (internal)."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: reads into one reusable buffer instead of a new bytes per chunk
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        hasher = hashlib.sha256()
+        # Read file in 1 MiB chunks: few read() calls, bounded memory for large PDFs
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
 
 
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers see either its previous or its complete new content.
+
+    The data goes to a temporary file next to the target, which then replaces it with
+    os.replace (atomic on POSIX and Windows). A crash mid-write can't leave a truncated
+    cache file behind to be read, e.g. by the web server while a disassembly finishes.
+
+    Args:
+        path: Destination file path
+        data: File content
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def generate_cache_key(*inputs: Any) -> str:
     """Generate a 16-character cache key from inputs using SHA-256.
 
@@ -166,12 +211,13 @@ def save_to_cache(data: Any, cache_key: str, stage: str, extension: str = "json"
     cache_file = cache_dir / f"{cache_key}.{extension}"
 
     if extension == "json":
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson encodes straight to UTF-8 bytes in C, much faster than json.dump on
+        # large structure documents, and the file is written in a single call
+        write_bytes_atomic(cache_file, orjson.dumps(data, option=JSON_CACHE_OPTIONS))
     else:
         # Text format
         content = data if isinstance(data, str) else str(data)
-        cache_file.write_text(content, encoding="utf-8")
+        write_bytes_atomic(cache_file, content.encode("utf-8"))
 
     return cache_file
 
@@ -199,13 +245,18 @@ def load_from_cache(cache_key: str, stage: str, extension: str = "json") -> Any:
         raise FileNotFoundError(f"Cache file not found: {cache_key}.{extension} in {stage}/")
 
     if extension == "json":
-        with open(cache_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(cache_file.read_bytes())
     else:
         return cache_file.read_text(encoding="utf-8")
 
 
-def generate_disassemble_cache_key(pdf: Path, enable_ocr: bool) -> tuple[str, str]:
+def generate_disassemble_cache_key(
+    pdf: Path,
+    enable_ocr: bool,
+    exclude_pages: Optional[Set[int]] = None,
+    pdf_backend: Optional[str] = None,
+    include_density: bool = False,
+) -> tuple[str, str]:
     """Generate cache key for disassemble stage.
 
     Cache key = SHA-256(PDF checksum + Docling options)
@@ -213,6 +264,9 @@ def generate_disassemble_cache_key(pdf: Path, enable_ocr: bool) -> tuple[str, st
     Args:
         pdf: Path to PDF file
         enable_ocr: OCR enabled flag
+        exclude_pages: 1-indexed page numbers skipped during extraction (default: none)
+        pdf_backend: Non-default PDF parsing backend name (default: the default backend)
+        include_density: Whether page density profiles are embedded (default: False)
 
     Returns:
         Tuple of (16-character cache key, 64-character PDF checksum)
@@ -221,7 +275,14 @@ def generate_disassemble_cache_key(pdf: Path, enable_ocr: bool) -> tuple[str, st
     pdf_checksum = calculate_file_checksum(pdf)
 
     # Docling 2.0: layout model is always docling_layout_heron, so we don't include it in cache key
-    docling_options = {"enable_ocr": enable_ocr}
+    docling_options: Dict[str, Any] = {"enable_ocr": enable_ocr}
+    # Only added when set, so keys for full-document runs are unchanged
+    if exclude_pages:
+        docling_options["exclude_pages"] = sorted(exclude_pages)
+    if pdf_backend:
+        docling_options["pdf_backend"] = pdf_backend
+    if include_density:
+        docling_options["include_density"] = True
 
     # Hash checksum + options instead of file bytes + options
     cache_key = generate_cache_key(pdf_checksum, docling_options)
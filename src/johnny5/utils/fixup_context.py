@@ -7,7 +7,7 @@ information to fixup processing functions.
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, Set, cast
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,10 @@ class FixupContext:
     - str → relabel cluster
     - dict → replace cluster
     - list[dict] → split cluster
+
+    pages, structure and metadata are the document's own objects, not copies: a
+    fixup edits them in place (marking the pages it changes with mark_page_dirty)
+    and returns None, so no second copy of the document is ever made.
     """
 
     pdf_path: Path
@@ -37,6 +41,24 @@ class FixupContext:
     metadata: Dict[str, Any]
     """Document metadata including processing parameters"""
 
+    dirty_pages: Optional[Set[int]] = None
+    """Page numbers whose elements were changed by the fixup (None: unknown, so all pages)"""
+
+    def mark_page_dirty(self, page_number: int) -> None:
+        """
+        Record that the fixup changed the elements of a page.
+
+        Once any page is marked, only marked pages get their density profiles
+        recomputed after the fixup. A fixup that changes no elements can set
+        dirty_pages to an empty set to skip the recomputation entirely.
+
+        Args:
+            page_number: Page number (1-indexed)
+        """
+        if self.dirty_pages is None:
+            self.dirty_pages = set()
+        self.dirty_pages.add(page_number)
+
     def get_page_elements(self, page_number: int) -> List[Dict[str, Any]]:
         """
         Get elements for a specific page.
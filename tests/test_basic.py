@@ -1,5 +1,7 @@
 """Basic tests for Johnny5 package"""
 
+from pathlib import Path
+
 from johnny5 import __version__
 
 
@@ -57,3 +59,59 @@ def test_recomposer_placeholder() -> None:
     sig_html = inspect.signature(json_to_html)
     assert "json_path" in sig_html.parameters
     assert "output_path" in sig_html.parameters
+
+
+def test_cli_import_is_lazy() -> None:
+    """Test that importing the CLI doesn't load Docling or FastAPI"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, johnny5.cli; "
+        "loaded = [m for m in ('docling', 'fastapi') if m in sys.modules]; "
+        "print(', '.join(loaded))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "", f"Eagerly imported: {result.stdout.strip()}"
+
+
+def test_recomposer_reuses_parsed_json(tmp_path: Path) -> None:
+    """Test that recomposer JSON loads are shared until the file changes"""
+    import os
+
+    from johnny5.recomposer import _load_json
+
+    json_path = tmp_path / "doc.json"
+    json_path.write_text('{"version": 1}', encoding="utf-8")
+    first = _load_json(json_path)
+    assert _load_json(json_path) is first
+
+    json_path.write_text('{"version": 22}', encoding="utf-8")
+    stat = json_path.stat()
+    os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert _load_json(json_path) == {"version": 22}
+
+
+def test_json_to_html_escapes_metadata(tmp_path: Path) -> None:
+    """Test that metadata text is HTML-escaped in the generated page"""
+    import orjson
+
+    from johnny5.recomposer import json_to_html
+
+    json_path = tmp_path / "doc.json"
+    document = {
+        "metadata": {
+            "source_pdf": "<b>R&D</b>.pdf",
+            "layout_model": "heron",
+            "ocr_enabled": False,
+            "json_dpi": 72,
+        },
+        "structure": {"tables": [], "figures": [], "text_blocks": []},
+    }
+    json_path.write_bytes(orjson.dumps(document))
+
+    html_text = json_to_html(json_path).read_text(encoding="utf-8")
+
+    assert "&lt;b&gt;R&amp;D&lt;/b&gt;.pdf" in html_text
+    assert "<b>R&D</b>" not in html_text
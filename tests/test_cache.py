@@ -0,0 +1,90 @@
+"""Tests for cache utilities
+
+This module tests the cache file helpers in johnny5.utils.cache.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from johnny5.utils.cache import (
+    calculate_file_checksum,
+    generate_disassemble_cache_key,
+    load_from_cache,
+    save_to_cache,
+    write_bytes_atomic,
+)
+
+
+def test_save_to_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that JSON cache files are compact UTF-8 and load back unchanged."""
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    data = {"metadata": {"source_pdf": "café.pdf"}, "pages": [{"width": 612.5, "elements": []}]}
+
+    cache_file = save_to_cache(data, "0123456789abcdef", "structure")
+
+    text = cache_file.read_text(encoding="utf-8")
+    assert "café.pdf" in text
+    assert "\n" not in text
+    assert load_from_cache("0123456789abcdef", "structure") == data
+
+
+def test_save_to_cache_converts_like_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that non-string keys and NumPy arrays are written as plain JSON."""
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+
+    cache_file = save_to_cache({1: np.array([0.5, 1.0])}, "0123456789abcdef", "structure")
+
+    assert json.loads(cache_file.read_text(encoding="utf-8")) == {"1": [0.5, 1.0]}
+
+
+def test_disassemble_cache_key_includes_excluded_pages(example_pdf: Path) -> None:
+    """Test that excluding pages changes the cache key, and excluding none does not."""
+    full_key, checksum = generate_disassemble_cache_key(example_pdf, False)
+
+    assert generate_disassemble_cache_key(example_pdf, False, set()) == (full_key, checksum)
+    assert generate_disassemble_cache_key(example_pdf, False, {1})[0] != full_key
+
+
+def test_disassemble_cache_key_includes_pdf_backend(example_pdf: Path) -> None:
+    """Test that a non-default PDF backend changes the cache key."""
+    full_key, _ = generate_disassemble_cache_key(example_pdf, False)
+
+    assert generate_disassemble_cache_key(example_pdf, False, None, "docling-parse")[0] != full_key
+
+
+def test_file_checksum_tracks_file_changes(tmp_path: Path) -> None:
+    """Test that memoized checksums are recomputed when the file changes."""
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1")
+    first = calculate_file_checksum(pdf)
+    assert calculate_file_checksum(pdf) == first
+
+    pdf.write_bytes(b"%PDF-22")
+    assert calculate_file_checksum(pdf) == hashlib.sha256(b"%PDF-22").hexdigest()
+
+
+def test_write_bytes_atomic_replaces_file(tmp_path: Path) -> None:
+    """Test that atomic writes replace the file's content and leave no temporary file."""
+    target = tmp_path / "structure.json"
+    target.write_bytes(b"old")
+
+    write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [path.name for path in tmp_path.iterdir()] == ["structure.json"]
+
+
+def test_write_bytes_atomic_failure_keeps_old_file(tmp_path: Path) -> None:
+    """Test that a failed write leaves the previous file intact and no temporary file."""
+    target = tmp_path / "structure.json"
+    target.write_bytes(b"old")
+
+    with pytest.raises(TypeError):
+        write_bytes_atomic(target, "not bytes")  # type: ignore[arg-type]
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["structure.json"]
@@ -0,0 +1,75 @@
+"""Tests for the command line interface
+
+This module tests the johnny5.cli commands with their heavy work stubbed out.
+"""
+
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+from click.testing import CliRunner
+
+from johnny5 import cli
+
+
+def test_to_pdf_renders_each_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that to-pdf renders every distinct file in parallel jobs, once each."""
+    rendered: List[Path] = []
+    lock = threading.Lock()
+
+    def render(file: Path) -> Path:
+        with lock:
+            rendered.append(file)
+        return file.with_suffix(".pdf")
+
+    monkeypatch.setattr(cli, "render_qmd_to_pdf", render)
+    files = [tmp_path / "a.qmd", tmp_path / "b.qmd"]
+    for file in files:
+        file.write_text("# Doc\n", encoding="utf-8")
+    args = ["to-pdf", str(files[0]), str(files[1]), str(files[0]), "--jobs", "2"]
+
+    result = CliRunner().invoke(cli.main, args)
+
+    assert result.exit_code == 0
+    assert sorted(rendered) == [file.resolve() for file in files]
+    assert result.output.count("✅ PDF generated") == 2
+
+
+def test_to_pdf_stops_when_quarto_is_missing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing Quarto is reported once and fails the command."""
+
+    def render(file: Path) -> Path:
+        raise RuntimeError("Quarto not found. Please install Quarto to render QMD files to PDF.")
+
+    monkeypatch.setattr(cli, "render_qmd_to_pdf", render)
+    files = [tmp_path / f"{name}.qmd" for name in "abc"]
+    for file in files:
+        file.write_text("# Doc\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli.main, ["to-pdf", *map(str, files), "--jobs", "1"])
+
+    assert result.exit_code == 1
+    assert result.output.count("Quarto not found") == 1
+
+
+@pytest.mark.parametrize("pages", ["0", "2,-1"])  # type: ignore[misc]
+def test_disassemble_rejects_pages_below_one(
+    pages: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that --exclude-pages rejects page numbers below 1 before converting anything."""
+    from johnny5 import disassembler
+
+    def run_batch(*args: object, **kwargs: object) -> List[str]:
+        raise AssertionError("nothing should be disassembled")
+
+    monkeypatch.setattr(disassembler, "run_disassemble_batch", run_batch)
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-doc")
+
+    result = CliRunner().invoke(cli.main, ["disassemble", str(pdf), "--exclude-pages", pages])
+
+    assert result.exit_code == 2
+    assert "Page numbers start at 1" in result.output
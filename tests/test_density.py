@@ -3,7 +3,17 @@
 This module tests the density calculation functions in johnny5.utils.density.
 """
 
-from johnny5.utils.density import calculate_density
+from typing import Any, Dict, List
+
+import numpy as np
+
+from johnny5.utils.density import (
+    DENSITY_DECIMALS,
+    calculate_density,
+    calculate_document_densities,
+    calculate_page_densities,
+    calculate_page_density_arrays,
+)
 
 
 def test_calculate_density_empty() -> None:
@@ -87,3 +97,63 @@ def test_calculate_density_profile_format() -> None:
         assert isinstance(density, (int, float))
         assert 0.0 <= density <= 1.0
         assert 0 <= axis_coord <= 792.0
+
+
+def test_calculate_density_overlapping_elements() -> None:
+    """Test that overlapping elements count once and coverage is clamped to the page."""
+    elements = [
+        {"bbox": [0, 100, 100, 300]},
+        {"bbox": [50, 200, 150, 400]},  # Overlaps the first element for y in 200-300
+        {"bbox": [100, 700, 200, 900]},  # Extends below the page
+    ]
+    x_profile = dict(calculate_density(elements, 600.0, 800.0, "x"))
+
+    assert x_profile == {
+        0.0: 0.25,
+        50.0: 0.375,
+        100.0: 0.5,  # All three elements touch x=100: 100-400 plus 700-800
+        150.0: 0.375,
+        200.0: 0.125,
+        600.0: 0.0,
+    }
+
+
+def test_calculate_density_rounds_values() -> None:
+    """Test that density values are rounded to DENSITY_DECIMALS places."""
+    elements = [{"bbox": [0, 0, 100, 100]}]
+    x_profile = calculate_density(elements, 300.0, 300.0, "x")
+
+    assert x_profile[0] == (0.0, round(1 / 3, DENSITY_DECIMALS))
+
+
+def test_calculate_document_densities_matches_per_page() -> None:
+    """Test that document densities match per-page calculation, in page order."""
+    pages: List[Dict[str, Any]] = [
+        {
+            "width": 612.0,
+            "height": 792.0,
+            "elements": [{"bbox": [10.0 * i, 20.0, 100.0 + 10.0 * i, 60.0 + i]}],
+        }
+        for i in range(9)
+    ]
+
+    densities = calculate_document_densities(pages)
+
+    assert len(densities) == len(pages)
+    for density, page in zip(densities, pages):
+        expected = calculate_page_density_arrays(page["elements"], page["width"], page["height"])
+        for axis in ("x", "y"):
+            np.testing.assert_array_equal(density[axis], expected[axis])
+
+
+def test_calculate_page_density_arrays() -> None:
+    """Test that density arrays are float32 (N, 2) forms of the calculate_density profiles."""
+    elements = [{"bbox": [0, 0, 100, 100]}, {"bbox": [50, 200, 300, 250]}]
+
+    arrays = calculate_page_density_arrays(elements, 612.0, 792.0)
+    profiles = calculate_page_densities(elements, 612.0, 792.0)
+
+    for axis in ("x", "y"):
+        assert arrays[axis].dtype == np.float32
+        np.testing.assert_allclose(arrays[axis], np.array(profiles[axis]), rtol=1e-6)
+    assert calculate_page_density_arrays([], 612.0, 792.0)["x"].shape == (0, 2)
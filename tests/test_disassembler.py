@@ -0,0 +1,190 @@
+"""Tests for disassembler helpers
+
+This module tests how johnny5.disassembler turns Docling's page models into elements.
+"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from docling.datamodel.base_models import Cluster, LayoutPrediction, Page, PagePredictions
+from docling_core.types.doc.base import BoundingBox, Size
+from docling_core.types.doc.labels import DocItemLabel
+from docling_core.types.doc.page import BoundingRectangle, TextCell
+
+from johnny5.disassembler import _extract_element_data_from_cluster, _init_batch_worker
+from johnny5.utils.cache import save_to_cache
+
+
+def _make_cell(index: int, text: str) -> TextCell:
+    """Create a Docling text cell with a unit rectangle."""
+    rect = BoundingRectangle(r_x0=0, r_y0=0, r_x1=1, r_y1=0, r_x2=1, r_y2=1, r_x3=0, r_y3=1)
+    return TextCell(index=index, rect=rect, text=text, orig=text, from_ocr=False)
+
+
+def test_extract_element_data_from_cluster() -> None:
+    """Test that a layout cluster becomes an element with its bbox and cell text."""
+    cluster = Cluster(
+        id=0,
+        label=DocItemLabel.SECTION_HEADER,
+        bbox=BoundingBox(l=10, t=20, r=110, b=40),
+        confidence=0.9,
+        cells=[_make_cell(0, "1."), _make_cell(1, "Introduction")],
+    )
+
+    element = _extract_element_data_from_cluster(cluster, 3)
+
+    assert element == {
+        "type": "section_header",
+        "page": 3,
+        "bbox": [10.0, 20.0, 110.0, 40.0],
+        "confidence": 0.9,
+        "content": "1. Introduction",
+    }
+
+
+def test_extract_element_data_from_cluster_without_cells() -> None:
+    """Test that a cluster without text cells has no content."""
+    cluster = Cluster(
+        id=1, label=DocItemLabel.PICTURE, bbox=BoundingBox(l=0, t=0, r=50, b=50), confidence=0.5
+    )
+
+    element = _extract_element_data_from_cluster(cluster, 1)
+
+    assert element is not None
+    assert "content" not in element
+
+
+def test_run_docling_conversion_builds_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that converted pages carry their elements, margins, and skipped state."""
+    from johnny5 import disassembler
+
+    cluster = Cluster(
+        id=0,
+        label=DocItemLabel.TEXT,
+        bbox=BoundingBox(l=72, t=100, r=540, b=120),
+        confidence=0.8,
+        cells=[_make_cell(0, "Hello")],
+    )
+    pages = [
+        Page(
+            page_no=number,
+            size=Size(width=612, height=792),
+            predictions=PagePredictions(layout=LayoutPrediction(clusters=[cluster])),
+        )
+        for number in (0, 1)
+    ]
+    converter = SimpleNamespace(convert=lambda source: SimpleNamespace(pages=pages))
+    monkeypatch.setattr(disassembler, "_get_converter", lambda *args: converter)
+
+    result = disassembler._run_docling_conversion(tmp_path / "doc.pdf", False, "0" * 64, {2})
+
+    first, second = result["pages"]
+    assert first["elements"][0]["content"] == "Hello"
+    assert first["margins"]["left"] == 72
+    assert "_density" not in first
+    assert second == {
+        "page_number": 2,
+        "width": 612,
+        "height": 792,
+        "elements": [],
+        "skipped": True,
+        "margins": {"left": 0.0, "right": 0.0, "top": 0.0, "bottom": 0.0},
+    }
+    assert [block["page"] for block in result["structure"]["text_blocks"]] == [1]
+
+
+def test_run_disassemble_batch_converts_only_misses(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a batch converts each uncached PDF once and returns keys in order."""
+    from johnny5 import disassembler
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path / "home"))
+    cached, fresh = tmp_path / "cached.pdf", tmp_path / "fresh.pdf"
+    cached.write_bytes(b"%PDF-cached")
+    fresh.write_bytes(b"%PDF-fresh")
+    cached_key, _ = disassembler._disassemble_cache_key(
+        cached, False, None, disassembler.DEFAULT_PDF_BACKEND, False
+    )
+    save_to_cache({"pages": []}, cached_key, "structure")
+
+    converted: List[Path] = []
+
+    def convert(pdf: Path, *args: Any) -> Dict[str, Any]:
+        converted.append(pdf)
+        return {"pages": []}
+
+    monkeypatch.setattr(disassembler, "_run_docling_conversion", convert)
+
+    keys = disassembler.run_disassemble_batch([fresh, cached, fresh], False, "", max_workers=4)
+
+    assert converted == [fresh]
+    assert keys[1] == cached_key
+    assert keys[0] == keys[2] != cached_key
+
+
+def test_run_disassemble_batch_dedupes_forced_refresh(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a forced sequential batch still converts a repeated PDF once."""
+    from johnny5 import disassembler
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path / "home"))
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-doc")
+    converted: List[Path] = []
+
+    def convert(pdf: Path, *args: Any) -> Dict[str, Any]:
+        converted.append(pdf)
+        return {"pages": []}
+
+    monkeypatch.setattr(disassembler, "_run_docling_conversion", convert)
+
+    keys = disassembler.run_disassemble_batch([pdf, pdf], False, "", force_refresh=True)
+
+    assert converted == [pdf]
+    assert keys[0] == keys[1]
+
+
+def _record_conversion(pdf: Path, *args: Any) -> Dict[str, Any]:
+    """Stand in for Docling in a batch worker, logging the PDF and the worker's threads."""
+    log = Path(os.environ["JNY5_HOME"]) / "conversions.log"
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(f"{pdf.name} {os.environ['DOCLING_NUM_THREADS']}\n")
+    return {"pages": []}
+
+
+def _init_stubbed_batch_worker(num_threads: int) -> None:
+    """Initialize a batch worker as usual, with Docling conversion stubbed out."""
+    from johnny5 import disassembler
+
+    _init_batch_worker(num_threads)
+    setattr(disassembler, "_run_docling_conversion", _record_conversion)
+
+
+def test_run_disassemble_batch_worker_pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that spawned batch workers convert each miss once with their share of threads."""
+    from johnny5 import disassembler
+
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("JNY5_HOME", str(home))
+    monkeypatch.delenv("DOCLING_NUM_THREADS", raising=False)
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    # Spawned workers re-import modules, so the stub is installed by their initializer
+    monkeypatch.setattr(disassembler, "_init_batch_worker", _init_stubbed_batch_worker)
+    pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    for pdf in pdfs:
+        pdf.write_bytes(b"%PDF-" + pdf.name.encode())
+
+    keys = disassembler.run_disassemble_batch(pdfs + pdfs[:1], False, "", max_workers=2)
+
+    log = (home / "conversions.log").read_text(encoding="utf-8").splitlines()
+    assert sorted(log) == ["a.pdf 2", "b.pdf 2"]
+    assert keys[0] == keys[2] != keys[1]
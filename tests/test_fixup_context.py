@@ -0,0 +1,107 @@
+"""Tests for fixup context utilities
+
+This module tests FixupContext in johnny5.utils.fixup_context and how the
+disassembler loads fixup modules and refreshes density after fixups.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from johnny5.utils.fixup_context import FixupContext
+
+
+def _make_pages() -> List[Dict[str, Any]]:
+    """Create two pages with one element each and stale density profiles."""
+    return [
+        {
+            "page_number": number,
+            "width": 100.0,
+            "height": 100.0,
+            "elements": [{"bbox": [0, 0, 50, 100]}],
+            "_density": {"x": [], "y": []},
+        }
+        for number in (1, 2)
+    ]
+
+
+def test_mark_page_dirty() -> None:
+    """Test that dirty pages are unknown until a fixup marks one."""
+    context = FixupContext(pdf_path=Path("doc.pdf"), pages=[], structure={}, metadata={})
+    assert context.dirty_pages is None
+
+    context.mark_page_dirty(3)
+    context.mark_page_dirty(3)
+    assert context.dirty_pages == {3}
+
+
+def test_recompute_density_only_for_dirty_pages() -> None:
+    """Test that density profiles are recomputed only for pages marked dirty."""
+    from johnny5.disassembler import _recompute_density_arrays
+
+    result = _recompute_density_arrays({"pages": _make_pages()}, dirty_pages={2})
+    assert result["pages"][0]["_density"] == {"x": [], "y": []}
+    assert len(result["pages"][1]["_density"]["x"])
+
+    result = _recompute_density_arrays({"pages": _make_pages()})
+    assert all(len(page["_density"]["x"]) for page in result["pages"])
+
+
+def test_fixup_module_reloads_when_source_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that fixup modules are reused until their source file changes."""
+    from johnny5.disassembler import _import_fixup_module
+
+    source = tmp_path / "j5_reload_fixup.py"
+    source.write_text("VERSION = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "j5_reload_fixup", raising=False)
+
+    module = _import_fixup_module("j5_reload_fixup")
+    assert module.VERSION == 1
+    assert _import_fixup_module("j5_reload_fixup") is module
+
+    source.write_text("VERSION = 22\n", encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert _import_fixup_module("j5_reload_fixup").VERSION == 22
+    sys.modules.pop("j5_reload_fixup", None)
+
+
+def test_in_place_fixup_shares_document(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a fixup returning None edits the document itself, with density refreshed."""
+    from johnny5.disassembler import _apply_fixup_rules
+
+    source = tmp_path / "j5_in_place_fixup.py"
+    source.write_text(
+        "def apply_fixup(context):\n"
+        "    context.get_page_elements(2).append({'bbox': [50, 0, 100, 100]})\n"
+        "    context.mark_page_dirty(2)\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "j5_in_place_fixup", raising=False)
+
+    pages = _make_pages()
+    document: Dict[str, Any] = {"pages": pages, "structure": {}, "metadata": {}}
+    result = _apply_fixup_rules(document, "j5_in_place_fixup", Path("doc.pdf"))
+
+    assert result is document
+    assert len(pages[1]["elements"]) == 2
+    assert pages[0]["_density"] == {"x": [], "y": []}
+    assert len(pages[1]["_density"]["x"])
+    sys.modules.pop("j5_in_place_fixup", None)
+
+
+def test_empty_fixup_skips_processing() -> None:
+    """Test that an empty fixup module path returns the document untouched."""
+    from johnny5.disassembler import _apply_fixup_rules
+
+    document: Dict[str, Any] = {"pages": _make_pages(), "structure": {}, "metadata": {}}
+
+    assert _apply_fixup_rules(document, "", Path("doc.pdf")) is document
+    assert document["pages"][0]["_density"] == {"x": [], "y": []}
@@ -0,0 +1,56 @@
+"""Tests for QMD quality checks
+
+This module tests QMDChecker in johnny5.qmd_checker.
+"""
+
+from pathlib import Path
+
+from johnny5.qmd_checker import QMDChecker
+
+
+def _make_checker(tmp_path: Path, text: str) -> QMDChecker:
+    """Write a QMD file and return a checker for it."""
+    qmd = tmp_path / "doc.qmd"
+    qmd.write_text(text, encoding="utf-8")
+    return QMDChecker(qmd)
+
+
+def test_table_alignment(tmp_path: Path) -> None:
+    """Test that aligned tables pass and each misaligned row is reported once."""
+    checker = _make_checker(
+        tmp_path,
+        "| a | b |\n|---|---|\n| 1 | 2 |\n\nText\n\n  | a | b |\n  |---|--|\n  | 10 | 20 |\n",
+    )
+
+    result = checker.check_table_alignment()
+
+    assert result["tables_found"] == 2
+    assert result["tables_aligned"] == 1
+    assert result["issues"] == [
+        "Line 8, column 3: Pipe misaligned (expected position 10, found at 9)",
+        "Line 9, column 2: Pipe misaligned (expected position 6, found at 7)",
+    ]
+
+
+def test_markdown_syntax(tmp_path: Path) -> None:
+    """Test that trailing whitespace and deep headings are reported."""
+    checker = _make_checker(tmp_path, "### Fine\n  #### Deep\nTrailing \nTab\t \n")
+
+    assert checker.check_markdown_syntax()["issues"] == [
+        "Line 2: Heading level 4+ (consider restructuring)",
+        "Line 3: Trailing whitespace",
+        "Line 4: Trailing whitespace",
+    ]
+
+
+def test_check_all_collects_issues(tmp_path: Path) -> None:
+    """Test that check_all lists every check's issues, in check order."""
+    checker = _make_checker(tmp_path, "| a | b |\n| 1  | 2 |\n#### Deep \n")
+
+    results = checker.check_all()
+
+    assert results["issues"] == [
+        issue for check in results["checks"].values() for issue in check["issues"]
+    ]
+    assert results["issues"][0].startswith("Line 2, column 2")
+    assert "Missing YAML frontmatter" in results["issues"]
@@ -0,0 +1,39 @@
+"""Tests for QMD rendering
+
+This module tests how render_qmd_to_pdf in johnny5.render reports failures.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from johnny5.render import render_qmd_to_pdf
+
+
+def test_missing_quarto_is_reported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing Quarto executable is reported as such."""
+    qmd = tmp_path / "doc.qmd"
+    qmd.write_text("# Doc\n", encoding="utf-8")
+
+    def run(*args: Any, **kwargs: Any) -> None:
+        raise FileNotFoundError("quarto")
+
+    monkeypatch.setattr(subprocess, "run", run)
+
+    with pytest.raises(RuntimeError, match="Quarto not found"):
+        render_qmd_to_pdf(qmd)
+
+
+def test_missing_output_is_not_reported_as_missing_quarto(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that failing to move the rendered PDF surfaces as an OSError."""
+    qmd = tmp_path / "doc.qmd"
+    qmd.write_text("# Doc\n", encoding="utf-8")
+    # Quarto "succeeds" without writing a PDF
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: None)
+
+    with pytest.raises(FileNotFoundError):
+        render_qmd_to_pdf(qmd)
@@ -0,0 +1,209 @@
+"""Tests for the Johnny5 web server"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def test_root_renders_color_scheme(client: TestClient) -> None:
+    """Test that the index page is rendered with the configured color scheme"""
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "/static/css/color/dark.css" in response.text
+
+
+def test_structure_reloads_when_cache_file_changes(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached structure data is reused until the cache file is rewritten"""
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+
+    page = {"page_number": 1, "width": 612, "height": 792, "elements": []}
+    document = {
+        "metadata": {"pdf_checksum": "abc"},
+        "pages": [page],
+        "structure": {"tables": [], "figures": [], "text_blocks": []},
+    }
+    cache_file.write_text(json.dumps(document), encoding="utf-8")
+    response = client.get("/api/structure/1", params={"cache_key": "0123456789abcdef"})
+    assert response.json()["page"]["width"] == 612
+
+    page["width"] = 600
+    cache_file.write_text(json.dumps(document), encoding="utf-8")
+    stat = cache_file.stat()
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    response = client.get("/api/structure/1", params={"cache_key": "0123456789abcdef"})
+    assert response.json()["page"]["width"] == 600
+
+    # A rewrite that keeps the mtime (coarse timestamps) is still caught by the size
+    stat = cache_file.stat()
+    page["width"] = 1224
+    cache_file.write_text(json.dumps(document), encoding="utf-8")
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    response = client.get("/api/structure/1", params={"cache_key": "0123456789abcdef"})
+    assert response.json()["page"]["width"] == 1224
+
+
+def test_structure_and_density_report_missing_page(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that both page endpoints report an out-of-range page the same way"""
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+    page = {"page_number": 1, "width": 612, "height": 792, "elements": []}
+    cache_file.write_text(json.dumps({"pages": [page]}), encoding="utf-8")
+
+    for endpoint in ("structure", "density"):
+        response = client.get(f"/api/{endpoint}/2", params={"cache_key": "0123456789abcdef"})
+        assert response.json() == {"error": "Page 2 not found (available: 1-1)"}
+
+
+def test_density_returns_page_series(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the density endpoint returns the page's density series as JSON"""
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+    density = {"x": [[0.0, 0.5], [1.0, 0.25]], "y": [[0.0, 1.0]]}
+    page = {"page_number": 1, "width": 612, "height": 792, "elements": [], "_density": density}
+    cache_file.write_text(json.dumps({"pages": [page]}), encoding="utf-8")
+
+    response = client.get("/api/density/1", params={"cache_key": "0123456789abcdef"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {**density, "page_width": 612, "page_height": 792}
+
+
+def test_density_is_computed_when_not_embedded(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that pages without embedded _density get their profiles computed on demand"""
+    from johnny5.utils.density import calculate_page_densities
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+    elements = [{"bbox": [0, 0, 306, 396]}]
+    page = {"page_number": 1, "width": 612, "height": 792, "elements": elements}
+    cache_file.write_text(json.dumps({"pages": [page]}), encoding="utf-8")
+
+    response = client.get("/api/density/1", params={"cache_key": "0123456789abcdef"})
+
+    expected = json.loads(json.dumps(calculate_page_densities(elements, 612, 792)))
+    assert response.json() == {**expected, "page_width": 612, "page_height": 792}
+
+    # The computed profiles are cached apart from the shared structure data
+    response = client.get("/api/structure/1", params={"cache_key": "0123456789abcdef"})
+    assert "_density" not in response.json()["page"]
+
+
+def test_pdf_info_and_pending_status(
+    client: TestClient, example_pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that PDF info and the status of a job that never ran are plain JSON"""
+    from johnny5.utils.cache import calculate_file_checksum
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    checksum = calculate_file_checksum(example_pdf)
+
+    response = client.get("/api/pdf-info")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "pdf_path": str(example_pdf.resolve()),
+        "display_name": example_pdf.name,
+        "fixup_module": "johnny5.fixups.example_fixup",
+        "checksum": checksum,
+    }
+
+    params = {"pdf_checksum": checksum, "cache_key": "0123456789abcdef"}
+    response = client.get("/api/disassembly-status", params=params)
+    assert response.json() == {
+        "status": "pending",
+        "cache_key": "0123456789abcdef",
+        "cache_exists": False,
+    }
+
+
+def test_pdf_is_served_with_range_and_cache_headers(client: TestClient, example_pdf: Path) -> None:
+    """Test that the PDF endpoint supports range requests and browser cache revalidation"""
+    from johnny5.utils.cache import calculate_file_checksum
+
+    params = {"pdf_checksum": calculate_file_checksum(example_pdf)}
+    response = client.get("/api/pdf", params=params, headers={"Range": "bytes=0-4"})
+
+    assert response.status_code == 206
+    assert response.content == example_pdf.read_bytes()[:5]
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+    # Revalidating with the validators from the first response sends no body
+    for name, header in (("if-none-match", "etag"), ("if-modified-since", "last-modified")):
+        response = client.get("/api/pdf", params=params, headers={name: response.headers[header]})
+        assert response.status_code == 304
+        assert response.content == b""
+    response = client.get("/api/pdf", params=params, headers={"if-none-match": '"stale"'})
+    assert response.status_code == 200
+
+    response = client.get("/api/pdf", params={"pdf_checksum": "missing"})
+    assert response.status_code == 404
+
+
+def test_dump_density_writes_all_pages(
+    example_pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the density dump contains every page that has density data"""
+    from johnny5.server import _create_app
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    client = TestClient(_create_app(pdf=example_pdf, fixup="johnny5.fixups.example_fixup"))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+    density = {"x": [[0.0, 0.5]], "y": [[0.0, 1.0]]}
+    pages = [
+        {"page_number": 1, "width": 612, "height": 792, "elements": [], "_density": density},
+        {"page_number": 2, "width": 612, "height": 792, "elements": []},
+    ]
+    cache_file.write_text(json.dumps({"pages": pages}), encoding="utf-8")
+
+    response = client.post("/api/dump-density", params={"cache_key": "0123456789abcdef"})
+
+    result = response.json()
+    assert result["pages_dumped"] == 1
+    dump = json.loads(Path(result["file_path"]).read_text(encoding="utf-8"))
+    assert dump["pages"] == {"1": {**density, "page_width": 612, "page_height": 792}}
+
+
+def test_dump_density_computes_missing_profiles(
+    example_pdf: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the density dump includes profiles computed for pages without _density"""
+    from johnny5.server import _create_app
+
+    monkeypatch.setenv("JNY5_HOME", str(tmp_path))
+    client = TestClient(_create_app(pdf=example_pdf, fixup="johnny5.fixups.example_fixup"))
+    cache_file = tmp_path / "cache" / "structure" / "0123456789abcdef.json"
+    cache_file.parent.mkdir(parents=True)
+    elements = [{"bbox": [0, 0, 306, 396]}]
+    pages = [
+        {"page_number": number, "width": 612, "height": 792, "elements": elements}
+        for number in (1, 2)
+    ]
+    cache_file.write_text(json.dumps({"pages": pages}), encoding="utf-8")
+
+    response = client.post("/api/dump-density", params={"cache_key": "0123456789abcdef"})
+
+    result = response.json()
+    assert result["pages_dumped"] == 2
+    dump = json.loads(Path(result["file_path"]).read_text(encoding="utf-8"))
+    assert dump["pages"]["2"]["x"] == [[0.0, 0.5], [306.0, 0.5], [612.0, 0.0]]
+
+    response = client.get("/api/structure/2", params={"cache_key": "0123456789abcdef"})
+    assert "_density" not in response.json()["page"]